@@ -4,13 +4,18 @@ set -e
 # Default to uvloop if not specified
 LOOP_IMPL=${LOOP_IMPLEMENTATION:-uvloop}
 
+# One worker process per core unless overridden; each worker owns its own
+# DuckDB / Postgres / Valkey pools.
+WORKERS=${WEB_CONCURRENCY:-$(nproc)}
+
 if [ "$ENABLE_TRACING" = "true" ]; then
     echo "🔍 Tracing ENABLED. Manual spans will be exported."
     exec uv run granian \
         --interface asgi \
         --host 0.0.0.0 \
         --port 8080 \
-        --workers 1 \
+        --workers $WORKERS \
+        --runtime-mode st \
         --loop $LOOP_IMPL \
         src.main:app
 else
@@ -19,7 +24,8 @@ else
         --interface asgi \
         --host 0.0.0.0 \
         --port 8080 \
-        --workers 1 \
+        --workers $WORKERS \
+        --runtime-mode st \
         --loop $LOOP_IMPL \
         src.main:app
 fi
@@ -91,12 +91,12 @@ async def measure_polars_memory() -> tuple[float, int]:
         "SELECT id, user_id, event_type, page_url, metadata, created_at FROM user_events LIMIT 100"
     )
 
-    df = pl.DataFrame([dict(row) for row in rows]).with_columns(
-        pl.col("metadata").map_elements(
-            lambda x: json.loads(x) if isinstance(x, str) else x, return_dtype=pl.Object
-        ),
-        pl.col("created_at").cast(pl.Utf8),
-    )
+    # metadata has one wire type per result set: decide once whether it still
+    # needs parsing (the pool's jsonb codec may already have decoded it)
+    df = pl.DataFrame([dict(row) for row in rows], schema_overrides={"metadata": pl.Object})
+    if rows and isinstance(rows[0]["metadata"], str):
+        df = df.with_columns(pl.col("metadata").map_elements(json.loads, return_dtype=pl.Object))
+    df = df.with_columns(pl.col("created_at").cast(pl.Utf8))
     events = [UserEventResponseMsg(**row) for row in df.to_dicts()]
 
     snapshot_after = tracemalloc.take_snapshot()
@@ -38,9 +38,9 @@ def setup_db() -> None:
         FROM generate_series(1, 10000000)
     """)
     # Check single query time
-    start = time.time()
+    start = time.perf_counter()
     con.execute(QUERY).fetchall()
-    print(f"Single query baseline duration: {time.time() - start:.4f}s")
+    print(f"Single query baseline duration: {time.perf_counter() - start:.4f}s")
     con.close()
 
 
@@ -65,18 +65,18 @@ def run_single_connection_shared(num_queries: int) -> None:
     def worker() -> float:
         # Use a cursor for each thread to ensure isolation if connection is shared
         cursor = con.cursor()
-        start_t = time.time()
+        start_t = time.perf_counter_ns()
         cursor.execute(QUERY).fetchall()
-        dur = time.time() - start_t
+        dur = (time.perf_counter_ns() - start_t) / 1e9
         cursor.close()
         return dur
 
-    start_total = time.time()
+    start_total = time.perf_counter()
     with concurrent.futures.ThreadPoolExecutor(max_workers=num_queries) as executor:
         futures = [executor.submit(worker) for _ in range(num_queries)]
         results = [f.result() for f in futures]
 
-    total_time = time.time() - start_total
+    total_time = time.perf_counter() - start_total
 
     stop_event.set()
     mem_thread.join()
@@ -98,18 +98,18 @@ def run_connection_per_thread(num_queries: int) -> None:
     def worker() -> float:
         # Each thread gets its own connection
         local_con = duckdb.connect(DB_PATH, read_only=True)
-        start_t = time.time()
+        start_t = time.perf_counter_ns()
         local_con.execute(QUERY).fetchall()
-        dur = time.time() - start_t
+        dur = (time.perf_counter_ns() - start_t) / 1e9
         local_con.close()
         return dur
 
-    start_total = time.time()
+    start_total = time.perf_counter()
     with concurrent.futures.ThreadPoolExecutor(max_workers=num_queries) as executor:
         futures = [executor.submit(worker) for _ in range(num_queries)]
         results = [f.result() for f in futures]
 
-    total_time = time.time() - start_total
+    total_time = time.perf_counter() - start_total
 
     stop_event.set()
     mem_thread.join()
@@ -4,6 +4,7 @@ Thread-safe connection pooling to avoid recreating connections.
 """
 
 import asyncio
+import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from queue import Empty, Queue
@@ -15,6 +16,16 @@ from src.lib.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Remote I/O tuning applied to every pooled connection: cache HTTP/Parquet metadata
+# and keep connections alive so iceberg_scan() issues fewer, reused S3 requests.
+REMOTE_IO_SETTINGS = (
+    "SET enable_http_metadata_cache = true;",
+    "SET enable_object_cache = true;",
+    "SET http_keep_alive = true;",
+    "SET http_retries = 3;",
+    "SET http_retry_backoff = 1.5;",
+)
+
 
 class DuckDBConnectionPool:
     """Thread-safe DuckDB connection pool."""
@@ -33,8 +44,6 @@ class DuckDBConnectionPool:
 
     def _initialize_pool(self) -> None:
         """Create initial pool of connections."""
-        import os
-
         for _ in range(self.pool_size):
             conn = duckdb.connect(self.database, config=self.config)
             # Install and load required extensions
@@ -54,6 +63,11 @@ class DuckDBConnectionPool:
                     conn.execute("CALL load_aws_credentials();")
             except Exception as e:
                 print(f"Warning: Failed to load DuckDB extensions: {e}")
+            try:
+                for setting in REMOTE_IO_SETTINGS:
+                    conn.execute(setting)
+            except Exception as e:
+                print(f"Warning: Failed to apply DuckDB remote I/O settings: {e}")
             self._pool.put(conn)
 
     def _get_connection(self) -> duckdb.DuckDBPyConnection:
@@ -82,6 +96,29 @@ class DuckDBConnectionPool:
         finally:
             await asyncio.to_thread(self._return_connection, conn)
 
+    @asynccontextmanager
+    async def idle_connections(self) -> AsyncGenerator[list[duckdb.DuckDBPyConnection], None]:
+        """
+        Async context manager holding every currently idle connection (non-blocking,
+        possibly none), e.g. to warm them all concurrently. They are always returned
+        to the pool on exit.
+
+        Usage:
+            async with pool.idle_connections() as conns:
+                await asyncio.gather(*(asyncio.to_thread(warm, c) for c in conns))
+        """
+        conns = []
+        while True:
+            try:
+                conns.append(self._pool.get_nowait())
+            except Empty:
+                break
+        try:
+            yield conns
+        finally:
+            for conn in conns:
+                self._return_connection(conn)
+
     def close_all(self) -> None:
         """Close all connections in the pool."""
         while not self._pool.empty():
@@ -1,11 +1,73 @@
+import asyncio
 import os
 import subprocess  # nosec B404
+import time
+from typing import Any
 
 from src.lib.valkey_cache import valkey_cache
 
+# In-process TTL LRU in front of Valkey: path -> (expire_ts, cached response).
+# Valkey stays the shared cache across processes; this layer skips the network
+# round-trip for repeated lookups within the same process.
+_LOCAL_TTL_SECONDS = 60
+_LOCAL_MAXSIZE = 64
+_ttl: dict[str, tuple[float, dict[str, Any]]] = {}
+# One lock per path being resolved: concurrent misses for the same path share one
+# lookup, while a slow AWS CLI call never blocks cold lookups of other paths
+_path_locks: dict[str, asyncio.Lock] = {}
+
+
+def _local_get(s3_path: str) -> dict[str, Any] | None:
+    entry = _ttl.get(s3_path)
+    if entry is None:
+        return None
+    expire_ts, value = entry
+    if expire_ts < time.monotonic():
+        del _ttl[s3_path]
+        return None
+    # Move to the end so eviction drops the least recently used path
+    _ttl[s3_path] = _ttl.pop(s3_path)
+    return value
+
+
+async def get_latest_metadata_file(s3_path: str) -> dict[str, Any]:
+    """
+    Resolves the latest Iceberg metadata file, checking an in-process TTL cache
+    before falling through to the Valkey-cached resolver.
+
+    Returns:
+        Same dictionary shape as the Valkey cache decorator, with
+        source="local" when served from the in-process cache.
+    """
+    start = time.perf_counter()
+    value = _local_get(s3_path)
+    if value is None:
+        lock = _path_locks.setdefault(s3_path, asyncio.Lock())
+        try:
+            async with lock:
+                # Re-check: another task may have populated the entry while we waited
+                value = _local_get(s3_path)
+                if value is None:
+                    value = await _resolve_latest_metadata_file(s3_path)
+                    _ttl[s3_path] = (time.monotonic() + _LOCAL_TTL_SECONDS, value)
+                    while len(_ttl) > _LOCAL_MAXSIZE:
+                        del _ttl[next(iter(_ttl))]
+                    return value
+        finally:
+            # Later callers hit the TTL entry; tasks still waiting keep their reference
+            if _path_locks.get(s3_path) is lock:
+                del _path_locks[s3_path]
+
+    return {
+        **value,
+        "cache_hit": True,
+        "cache_time_ms": (time.perf_counter() - start) * 1000,
+        "source": "local",
+    }
+
 
 @valkey_cache(ttl=300, key_prefix="iceberg_metadata_path")
-async def get_latest_metadata_file(s3_path: str) -> str:
+async def _resolve_latest_metadata_file(s3_path: str) -> str:
     """
     Finds the latest Iceberg metadata JSON file using AWS CLI.
     Falls back to folder path if failing.
@@ -7,28 +7,96 @@ Provides:
 - Automatic OpenTelemetry trace context binding
 - Performance-optimized processors
 - Stack trace capture for errors
+- Background writer thread for JSON output (no stdout I/O on the request path)
 """
 
+import atexit
+import io
 import logging
+import os
+import queue
 import sys
+import threading
 from typing import Any
 
+import orjson
 import structlog
 from opentelemetry import trace
 from structlog.types import EventDict, WrappedLogger
 
 from src.middleware.log_correlation import get_request_id
 
+APP_NAME = "performant-python"
+
+_ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+
+
+def orjson_serializer(obj: Any, default: Any = None, **kwargs: Any) -> bytes:
+    """Serialize an event dict with orjson (C encoder instead of stdlib json)."""
+    return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS)
+
+
+# Per-thread cache of (pid, thread name) and the current span's hex IDs; reset in
+# forked children so workers don't report the parent's pid.
+_tls = threading.local()
+
+
+def _reset_process_meta() -> None:
+    global _tls
+    _tls = threading.local()
+
+
+os.register_at_fork(after_in_child=_reset_process_meta)
+
 
 def add_open_telemetry_spans(
     logger: WrappedLogger, method_name: str, event_dict: EventDict
 ) -> EventDict:
-    """Add OpenTelemetry trace and span IDs to log records."""
+    """
+    Add OpenTelemetry trace and span IDs to log records and emit the entry
+    as a Span Event, fetching the current span only once.
+    """
     span = trace.get_current_span()
-    if span and span.is_recording():
-        ctx = span.get_span_context()
-        event_dict["trace_id"] = format(ctx.trace_id, "032x")
-        event_dict["span_id"] = format(ctx.span_id, "016x")
+    ctx = span.get_span_context()
+    # Unsampled spans still carry valid IDs: keep them for log-to-trace correlation
+    if not ctx.is_valid:
+        return event_dict
+
+    # Spans usually emit several records: reuse the hex IDs while the span is unchanged
+    ids = getattr(_tls, "span_ids", None)
+    if ids is None or ids[0] != ctx.span_id or ids[1] != ctx.trace_id:
+        ids = _tls.span_ids = (
+            ctx.span_id,
+            ctx.trace_id,
+            format(ctx.trace_id, "032x"),
+            format(ctx.span_id, "016x"),
+        )
+    event_dict["trace_id"] = ids[2]
+    event_dict["span_id"] = ids[3]
+
+    # Span events only matter for traces that will be exported
+    if not span.is_recording():
+        return event_dict
+
+    # Primitive values are valid attribute values as-is; only stringify the rest
+    # (exclude timestamp/event which are redundant)
+    attributes = {
+        k: v if isinstance(v, (str, bool, int, float)) else str(v)
+        for k, v in event_dict.items()
+        if k not in ("event", "timestamp")
+    }
+    attributes["level"] = method_name
+
+    span.add_event(name=event_dict.get("event", "log"), attributes=attributes)
+    return event_dict
+
+
+def add_process_meta(logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
+    """Add pid and thread name, resolved once per thread."""
+    meta = getattr(_tls, "meta", None)
+    if meta is None:
+        meta = _tls.meta = {"pid": os.getpid(), "thread": threading.current_thread().name}
+    event_dict.update(meta)
     return event_dict
 
 
@@ -40,76 +108,171 @@ def add_request_id(logger: WrappedLogger, method_name: str, event_dict: EventDic
     return event_dict
 
 
-def emit_opentelemetry_event(
-    logger: WrappedLogger, method_name: str, event_dict: EventDict
-) -> EventDict:
-    """Emit the log entry as an OpenTelemetry Span Event."""
-    span = trace.get_current_span()
-    if span and span.is_recording():
-        # Clean attributes (exclude timestamp/event which are redundant)
-        attributes = {k: str(v) for k, v in event_dict.items() if k not in ("event", "timestamp")}
-        attributes["level"] = method_name
+# =============================================================================
+# Background log writer (JSON mode)
+# =============================================================================
 
-        span.add_event(name=event_dict.get("event", "log"), attributes=attributes)
-    return event_dict
+# Queue items are (line, flush_now); None stops the writer
+_log_queue: "queue.SimpleQueue[tuple[bytes, bool] | None]" = queue.SimpleQueue()
+_writer: threading.Thread | None = None
 
+# Lines are batched into one write(2) per buffer fill instead of one per log call
+_WRITE_BUFFER_SIZE = 128 * 1024
 
-def add_app_context(logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
-    """Add application-level context to all logs."""
-    event_dict["app"] = "performant-python"
-    return event_dict
+
+class _QueueLogger:
+    """structlog logger that hands rendered lines to the background writer."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str | None = None):
+        self.name = name
+
+    def _put(self, message: bytes, flush_now: bool) -> None:
+        if _writer is None:
+            # Writer stopped (shutdown) or not started: write inline
+            sys.stdout.buffer.write(message + b"\n")
+            sys.stdout.buffer.flush()
+            return
+        _log_queue.put((message, flush_now))
+
+    def msg(self, message: bytes) -> None:
+        self._put(message, False)
+
+    def urgent(self, message: bytes) -> None:
+        # Warnings and above are flushed immediately
+        self._put(message, True)
+
+    log = debug = info = msg
+    warn = warning = fatal = failure = err = error = critical = exception = urgent
+
+
+class _QueueLoggerFactory:
+    """Produce `_QueueLogger`s; the first positional argument is the logger name."""
+
+    def __call__(self, *args: Any) -> _QueueLogger:
+        return _QueueLogger(args[0] if args else None)
+
+
+def _open_stdout() -> io.BufferedWriter:
+    try:
+        raw = io.FileIO(sys.stdout.fileno(), "wb", closefd=False)
+    except (AttributeError, OSError, ValueError):
+        # stdout replaced by something without a real fd (e.g. test capture)
+        return io.BufferedWriter(sys.stdout.buffer, buffer_size=_WRITE_BUFFER_SIZE)  # type: ignore[arg-type]
+    return io.BufferedWriter(raw, buffer_size=_WRITE_BUFFER_SIZE)
+
+
+def _drain_log_queue(q: "queue.SimpleQueue[tuple[bytes, bool] | None]") -> None:
+    sys.stdout.flush()
+    out = _open_stdout()
+    try:
+        while True:
+            item = q.get()
+            if item is None:
+                break
+            line, flush_now = item
+            out.write(line)
+            out.write(b"\n")
+            # Flush once the backlog is drained, or right away for warnings+
+            if flush_now or q.empty():
+                out.flush()
+    finally:
+        out.flush()
+
+
+def _start_log_writer() -> None:
+    global _writer
+    _writer = threading.Thread(
+        target=_drain_log_queue, args=(_log_queue,), name="log-writer", daemon=True
+    )
+    _writer.start()
+
+
+def stop_logging() -> None:
+    """Flush queued log lines and stop the background writer (call on shutdown)."""
+    global _writer
+    writer = _writer
+    if writer is None:
+        return
+    _writer = None
+    _log_queue.put(None)
+    writer.join(timeout=5)
+
+
+def _restart_log_writer_in_child() -> None:
+    # Threads don't survive fork: give the child its own queue and writer
+    global _log_queue
+    if _writer is not None:
+        _log_queue = queue.SimpleQueue()
+        _start_log_writer()
+
+
+os.register_at_fork(after_in_child=_restart_log_writer_in_child)
+atexit.register(stop_logging)
+
+
+_CONFIGURED = False
 
 
 def configure_structlog(json_logs: bool | None = None) -> None:
     """
     Configure structlog for the application.
+    Call once at startup; subsequent calls are no-ops.
 
     Args:
         json_logs: If True, output JSON. If False, colored console.
                    If None, auto-detect (JSON if not a TTY, colored if TTY)
     """
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+    _CONFIGURED = True
+
     # Auto-detect if not specified
     if json_logs is None:
         json_logs = not sys.stderr.isatty()
 
-    # Configure standard logging to work with structlog
-    logging.basicConfig(
-        format="%(message)s",
-        level=logging.INFO,
-        stream=sys.stdout,
-    )
-
     # Common processors for all configurations
     processors: list[Any] = [
         # Add log level
         structlog.stdlib.add_log_level,
         # Add timestamp
         structlog.processors.TimeStamper(fmt="iso", utc=True),
-        # Add logger name
+        # Add logger name (stdlib and queue loggers both carry .name)
         structlog.stdlib.add_logger_name,
         # Add Request ID
         add_request_id,
-        # Add OpenTelemetry trace context
+        # Add pid/thread (cached per thread)
+        add_process_meta,
+        # Add OpenTelemetry trace context and emit as Span Event
         add_open_telemetry_spans,
-        # Emit as OpenTelemetry Span Event
-        emit_opentelemetry_event,
-        # Add app context
-        add_app_context,
         # Stack traces for exceptions
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
     ]
 
     if json_logs:
-        # Production: JSON output
-        processors.extend(
-            [
-                # Render as JSON
-                structlog.processors.JSONRenderer(sort_keys=True)
-            ]
+        # Production: JSON bytes queued to a background writer, bypassing stdlib logging
+        processors.append(
+            # Render as JSON (orjson, keys sorted)
+            structlog.processors.JSONRenderer(serializer=orjson_serializer)
         )
+        structlog.configure(
+            processors=processors,
+            wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+            context_class=dict,
+            logger_factory=_QueueLoggerFactory(),
+            cache_logger_on_first_use=True,
+        )
+        _start_log_writer()
     else:
-        # Development: Colored console output
+        # Development: Colored console output through standard logging
+        logging.basicConfig(
+            format="%(message)s",
+            level=logging.INFO,
+            stream=sys.stdout,
+        )
         processors.extend(
             [
                 # Add colors
@@ -119,14 +282,13 @@ def configure_structlog(json_logs: bool | None = None) -> None:
                 )
             ]
         )
-
-    structlog.configure(
-        processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
-        context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        cache_logger_on_first_use=True,
-    )
+        structlog.configure(
+            processors=processors,
+            wrapper_class=structlog.stdlib.BoundLogger,
+            context_class=dict,
+            logger_factory=structlog.stdlib.LoggerFactory(),
+            cache_logger_on_first_use=True,
+        )
 
 
 def get_logger(name: str | None = None) -> Any:
@@ -150,8 +312,5 @@ def get_logger(name: str | None = None) -> Any:
         {"event": "cache_hit", "key": "user:123", "latency_ms": 2.1,
          "timestamp": "2024-12-14T11:44:02.123456Z", "level": "info"}
     """
-    return structlog.get_logger(name)
-
-
-# Initialize on import with auto-detection
-configure_structlog()
+    # Static app tag travels as an initial value, not a per-call processor
+    return structlog.get_logger(name, app=APP_NAME)
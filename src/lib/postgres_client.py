@@ -6,10 +6,15 @@ asyncpg is the fastest PostgreSQL driver for Python (2-3x faster than psycopg).
 """
 
 import asyncio
+import logging
 import os
+from collections.abc import AsyncIterator, Iterable
+from contextlib import AbstractContextManager, asynccontextmanager, nullcontext
+from contextvars import ContextVar
 from typing import Any
 
 import asyncpg
+import msgspec
 from opentelemetry import trace
 
 from src.lib.logger import get_logger
@@ -18,13 +23,38 @@ logger = get_logger(__name__)
 
 tracer = trace.get_tracer("performant-python.postgres")
 
+# Per-query spans are opt-in: one span per DB call is measurable overhead on the hot path
+QUERY_SPANS = os.getenv("POSTGRES_QUERY_SPANS", "false").lower() == "true"
+
+# jsonb binary wire format: a version byte (1) followed by the JSON text
+_JSONB_VERSION = b"\x01"
+_JSON_ENCODER = msgspec.json.Encoder()
+_JSON_DECODER = msgspec.json.Decoder()
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    return _JSONB_VERSION + _JSON_ENCODER.encode(value)
+
+
+def _decode_jsonb(data: bytes) -> Any:
+    return _JSON_DECODER.decode(memoryview(data)[1:])
+
+
+# Connection held by PostgresPool.pinned() for the current task, if any
+_pinned_conn: ContextVar[asyncpg.Connection | None] = ContextVar("pg_pinned_conn", default=None)
+
+
+def _query_span(name: str) -> AbstractContextManager[Any]:
+    """Tracer span for a single query when POSTGRES_QUERY_SPANS=true, else a no-op."""
+    return tracer.start_as_current_span(name) if QUERY_SPANS else nullcontext()
+
 
 class PostgresPool:
     """
     PostgreSQL connection pool manager using asyncpg.
 
     Features:
-    - Connection pooling (10-20 connections)
+    - Connection pooling (per worker process, 2-10 connections by default)
     - Automatic retry with exponential backoff
     - Query instrumentation with OpenTelemetry
     - Prepared statements for performance
@@ -34,6 +64,20 @@ class PostgresPool:
         self.url = url
         self._pool: asyncpg.Pool | None = None
 
+    async def _init_connection(self, conn: asyncpg.Connection) -> None:
+        """
+        Per-connection setup: jsonb columns are decoded to Python objects (and
+        encoded from them) by msgspec inside asyncpg, so callers never parse JSON
+        text per row.
+        """
+        await conn.set_type_codec(
+            "jsonb",
+            encoder=_encode_jsonb,
+            decoder=_decode_jsonb,
+            schema="pg_catalog",
+            format="binary",
+        )
+
     async def init_pool(self, min_size: int = 5, max_size: int = 20) -> None:
         """
         Initialize asyncpg connection pool.
@@ -52,6 +96,13 @@ class PostgresPool:
                     min_size=min_size,
                     max_size=max_size,
                     command_timeout=60,
+                    # Per-connection statement cache used by execute/fetch*: hot queries
+                    # are parsed once per connection (explicit PreparedStatements can't be
+                    # kept across acquires - asyncpg invalidates them on release)
+                    statement_cache_size=1024,
+                    max_cached_statement_lifetime=0,
+                    max_inactive_connection_lifetime=300,
+                    init=self._init_connection,
                     server_settings={"application_name": "performant-python"},
                 )
 
@@ -60,16 +111,17 @@ class PostgresPool:
                     continue
                 async with self._pool.acquire() as conn:
                     version = await conn.fetchval("SELECT version()")
-                    logger.info(
+                    logger.debug(
                         "postgres_connected",
                         version=version.split(",")[0],
                         min_size=min_size,
                         max_size=max_size,
                     )
 
-                    # Get table stats
-                    count = await conn.fetchval("SELECT COUNT(*) FROM user_events")
-                    logger.info("postgres_table_stats", table="user_events", row_count=count)
+                    # Get table stats (only worth a full COUNT when debug logs are on)
+                    if logger.is_enabled_for(logging.DEBUG):
+                        count = await conn.fetchval("SELECT COUNT(*) FROM user_events")
+                        logger.debug("postgres_table_stats", table="user_events", row_count=count)
 
                 return
 
@@ -99,6 +151,58 @@ class PostgresPool:
             await self._pool.close()
             logger.info("postgres_pool_closed")
 
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[asyncpg.Connection]:
+        """The task's pinned connection if any, else one acquired for this call."""
+        if not self._pool:
+            raise RuntimeError("PostgreSQL pool not initialized")
+
+        conn = _pinned_conn.get()
+        if conn is not None:
+            yield conn
+        else:
+            async with self._pool.acquire() as conn:
+                yield conn
+
+    @asynccontextmanager
+    async def pinned(self) -> AsyncIterator[None]:
+        """
+        Hold one pooled connection for the current task: fetch() and
+        fetch_columns() reuse it instead of acquiring per call. Queries on a
+        pinned connection run one at a time - pin per task, not across gather().
+
+        Usage:
+            async with pg.pinned():
+                await get_user_events_pydantic_baseline(1)
+                await get_user_events_msgspec_polars(1)
+        """
+        if not self._pool:
+            raise RuntimeError("PostgreSQL pool not initialized")
+
+        async with self._pool.acquire() as conn:
+            token = _pinned_conn.set(conn)
+            try:
+                yield
+            finally:
+                _pinned_conn.reset(token)
+
+    async def fetch_columns(self, query: str, *args: Any) -> dict[str, list[Any]]:
+        """
+        Fetch a result set column-wise: {column name: list of values}.
+        Rows are transposed in one C-level zip, so callers building DataFrames
+        skip the per-row dict(record) step. Column names come from the first
+        record; an empty result takes them from the statement, prepared on the
+        same connection, so it still carries its columns.
+        """
+        async with self._connection() as conn:
+            with _query_span("postgres_fetch_columns"):
+                rows = await conn.fetch(query, *args)
+            if not rows:
+                stmt = await conn.prepare(query)
+                return {attr.name: [] for attr in stmt.get_attributes()}
+
+        return dict(zip(rows[0].keys(), map(list, zip(*rows, strict=True)), strict=True))
+
     async def execute(self, query: str, *args: Any) -> str:
         """
         Execute a query that doesn't return results (INSERT, UPDATE, DELETE).
@@ -109,22 +213,18 @@ class PostgresPool:
         if not self._pool:
             raise RuntimeError("PostgreSQL pool not initialized")
 
-        with tracer.start_as_current_span("postgres_execute"):
-            async with self._pool.acquire() as conn:
-                return await conn.execute(query, *args)  # type: ignore[no-any-return]
+        with _query_span("postgres_execute"):
+            return await self._pool.execute(query, *args)  # type: ignore[no-any-return]
 
     async def fetch(self, query: str, *args: Any) -> list[asyncpg.Record]:
         """
-        Fetch multiple rows.
+        Fetch multiple rows (on the pinned connection inside pinned()).
 
         Returns:
             List of Record objects (dict-like)
         """
-        if not self._pool:
-            raise RuntimeError("PostgreSQL pool not initialized")
-
-        with tracer.start_as_current_span("postgres_fetch"):
-            async with self._pool.acquire() as conn:
+        async with self._connection() as conn:
+            with _query_span("postgres_fetch"):
                 return await conn.fetch(query, *args)  # type: ignore[no-any-return]
 
     async def fetchrow(self, query: str, *args: Any) -> asyncpg.Record | None:
@@ -132,18 +232,16 @@ class PostgresPool:
         if not self._pool:
             raise RuntimeError("PostgreSQL pool not initialized")
 
-        with tracer.start_as_current_span("postgres_fetchrow"):
-            async with self._pool.acquire() as conn:
-                return await conn.fetchrow(query, *args)
+        with _query_span("postgres_fetchrow"):
+            return await self._pool.fetchrow(query, *args)
 
     async def fetchval(self, query: str, *args: Any) -> Any:
         """Fetch a single value."""
         if not self._pool:
             raise RuntimeError("PostgreSQL pool not initialized")
 
-        with tracer.start_as_current_span("postgres_fetchval"):
-            async with self._pool.acquire() as conn:
-                return await conn.fetchval(query, *args)
+        with _query_span("postgres_fetchval"):
+            return await self._pool.fetchval(query, *args)
 
     async def executemany(self, query: str, args: list[Any]) -> None:
         """
@@ -152,9 +250,26 @@ class PostgresPool:
         if not self._pool:
             raise RuntimeError("PostgreSQL pool not initialized")
 
-        with tracer.start_as_current_span("postgres_executemany"):
-            async with self._pool.acquire() as conn:
-                await conn.executemany(query, args)
+        with _query_span("postgres_executemany"):
+            await self._pool.executemany(query, args)
+
+    async def copy_records(
+        self, table: str, records: Iterable[tuple[Any, ...]], columns: list[str]
+    ) -> str:
+        """
+        Bulk insert rows with the binary COPY protocol.
+        One round trip for the whole batch instead of Bind/Execute per row.
+
+        Returns:
+            Command status (e.g., "COPY 1000")
+        """
+        if not self._pool:
+            raise RuntimeError("PostgreSQL pool not initialized")
+
+        with _query_span("postgres_copy_records"):
+            return await self._pool.copy_records_to_table(  # type: ignore[no-any-return]
+                table, records=records, columns=columns
+            )
 
 
 # Global PostgreSQL connection pool instance
@@ -177,5 +292,6 @@ async def init_postgres(url: str | None = None) -> PostgresPool:
         )
 
     _pg_pool = PostgresPool(url)
-    await _pg_pool.init_pool(min_size=5, max_size=20)
+    # Pools are per Granian worker: keep them small so N workers fit in max_connections
+    await _pg_pool.init_pool(min_size=2, max_size=10)
     return _pg_pool
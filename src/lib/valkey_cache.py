@@ -7,17 +7,18 @@ Using xxhash for fast non-cryptographic cache key hashing.
 """
 
 import asyncio
-import json
 import os
 import time
 from collections.abc import Callable
 from functools import wraps
-from typing import Any
+from typing import Any, NamedTuple
 
+import msgspec
 import orjson
 import valkey.asyncio as valkey
 import xxhash
 from opentelemetry import trace
+from starlette.responses import Response
 
 from src.lib.logger import get_logger
 
@@ -25,20 +26,42 @@ logger = get_logger(__name__)
 
 tracer = trace.get_tracer("performant-python.valkey-cache")
 
+# Write-behind settings: pending SETs are bounded and flushed in pipelined batches
+WRITE_QUEUE_SIZE = 1024
+WRITE_BATCH_SIZE = 64
+# How long a partial batch waits for more writes before it is flushed
+WRITE_LINGER_SECONDS = 0.005
+
+
+class Serializer(NamedTuple):
+    """Pair of functions converting cached values to and from bytes."""
+
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+
+# Default: JSON-compatible values (dicts/lists/scalars)
+ORJSON_SERIALIZER = Serializer(orjson.dumps, orjson.loads)
+
 
 class ValkeyCache:
     """Valkey connection pool and cache management."""
 
-    def __init__(self, url: str = "valkey://localhost:6379"):
+    def __init__(
+        self, url: str = "valkey://localhost:6379", serializer: Serializer = ORJSON_SERIALIZER
+    ):
         self.url = url
+        self.serializer = serializer
         self._pool: valkey.Valkey | None = None
+        self._write_q: asyncio.Queue[tuple[str, bytes, int]] | None = None
+        self._writer_task: asyncio.Task[None] | None = None
 
     async def init_pool(self) -> None:
         """Initialize Valkey connection pool."""
         self._pool = valkey.Valkey.from_url(
             self.url,
             encoding="utf-8",
-            decode_responses=False,  # We'll handle binary data with orjson
+            decode_responses=False,  # Values are bytes from the configured serializer
             max_connections=10,
             socket_connect_timeout=5,
             socket_timeout=5,
@@ -56,13 +79,63 @@ class ValkeyCache:
                     message="Cache will be disabled",
                 )
 
-    async def close(self) -> None:
-        """Close Valkey connection pool."""
+        # Background writer for set(): one pipelined round-trip per batch of writes
+        self._write_q = asyncio.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writer_task = asyncio.create_task(self._write_behind(self._write_q))
+        self._writer_task.add_done_callback(self._on_writer_done)
+
+    async def _write_behind(self, q: asyncio.Queue[tuple[str, bytes, int]]) -> None:
+        """Drain queued writes and flush them to Valkey with a non-transactional pipeline."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await q.get()]
+            deadline = loop.time() + WRITE_LINGER_SECONDS
+            while len(batch) < WRITE_BATCH_SIZE:
+                if not q.empty():
+                    batch.append(q.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(q.get(), remaining))
+                except TimeoutError:
+                    break
+
+            try:
+                if self._pool:
+                    with tracer.start_as_current_span("valkey_set_pipeline"):
+                        async with self._pool.pipeline(transaction=False) as pipe:
+                            for key, serialized, ttl in batch:
+                                pipe.setex(key, ttl, serialized)
+                            await pipe.execute()
+            except Exception as e:
+                logger.error("valkey_set_error", batch_size=len(batch), error=str(e))
+            finally:
+                for _ in batch:
+                    q.task_done()
+
+    @staticmethod
+    def _on_writer_done(task: asyncio.Task[None]) -> None:
+        # The writer only exits by cancellation; anything else means queued writes stall
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("valkey_writer_crashed", error=str(task.exception()))
+
+    async def close(self, drain_timeout: float = 5.0) -> None:
+        """Flush pending writes (bounded by `drain_timeout`), then close the pool."""
+        if self._writer_task:
+            if self._write_q is not None and not self._writer_task.done():
+                try:
+                    await asyncio.wait_for(self._write_q.join(), timeout=drain_timeout)
+                except TimeoutError:
+                    logger.warning("valkey_writes_abandoned", pending=self._write_q.qsize())
+            self._writer_task.cancel()
+            self._writer_task = None
         if self._pool:
             await self._pool.close()
 
-    async def get(self, key: str) -> Any | None:
-        """Get value from cache."""
+    async def get(self, key: str, serializer: Serializer | None = None) -> Any | None:
+        """Get value from cache (`serializer` overrides the cache default)."""
         if not self._pool:
             return None
 
@@ -70,24 +143,54 @@ class ValkeyCache:
             with tracer.start_as_current_span("valkey_get"):
                 data = await self._pool.get(key)
                 if data:
-                    return orjson.loads(data)
+                    return (serializer or self.serializer).loads(data)
                 return None
         except Exception as e:
             logger.error("valkey_get_error", key=key, error=str(e), exc_info=True)
             return None
 
-    async def set(self, key: str, value: Any, ttl: int = 300) -> None:
-        """Set value in cache with TTL (seconds)."""
-        if not self._pool:
+    async def set(
+        self, key: str, value: Any, ttl: int = 300, serializer: Serializer | None = None
+    ) -> None:
+        """
+        Set value in cache with TTL (seconds) (`serializer` overrides the cache default).
+        Write-behind: the value is queued for the background pipeline writer and
+        dropped if the queue is full (the cache is best-effort).
+        """
+        if not self._pool or self._write_q is None:
             return
 
         try:
-            with tracer.start_as_current_span("valkey_set"):
-                serialized = orjson.dumps(value)
-                await self._pool.setex(key, ttl, serialized)
+            serialized = (serializer or self.serializer).dumps(value)
+            self._write_q.put_nowait((key, serialized, ttl))
+        except asyncio.QueueFull:
+            logger.warning("valkey_set_dropped", key=key, queue_size=WRITE_QUEUE_SIZE)
         except Exception as e:
             logger.error("valkey_set_error", key=key, ttl=ttl, error=str(e), exc_info=True)
 
+    async def get_raw(self, key: str) -> bytes | None:
+        """Get the stored bytes untouched (no deserialization)."""
+        if not self._pool:
+            return None
+
+        try:
+            with tracer.start_as_current_span("valkey_get_raw"):
+                data: bytes | None = await self._pool.get(key)
+                return data or None
+        except Exception as e:
+            logger.error("valkey_get_error", key=key, error=str(e), exc_info=True)
+            return None
+
+    async def set_raw(self, key: str, blob: bytes, ttl: int = 300) -> None:
+        """Queue already-encoded bytes for the background writer (write-behind, like set)."""
+        if not self._pool or self._write_q is None:
+            return
+
+        try:
+            self._write_q.put_nowait((key, blob, ttl))
+        except asyncio.QueueFull:
+            logger.warning("valkey_set_dropped", key=key, queue_size=WRITE_QUEUE_SIZE)
+
     async def delete(self, key: str) -> None:
         """Delete key from cache."""
         if not self._pool:
@@ -121,10 +224,38 @@ async def init_valkey_cache(url: str | None = None) -> ValkeyCache:
     return _valkey_cache
 
 
+# Canonical (sorted-key) JSON for container arguments. msgspec is faster here;
+# orjson covers what sorted msgspec cannot encode (dicts with non-str keys).
+_KEY_ENCODER = msgspec.json.Encoder(enc_hook=str, order="sorted")
+_KEY_JSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def _encode_key_part(value: Any) -> bytes:
+    """Type-tagged bytes for one cache-key argument (scalars skip JSON entirely)."""
+    if isinstance(value, str):
+        return b"s" + value.encode()
+    if isinstance(value, bytes):
+        return b"b" + value
+    if isinstance(value, bool):
+        return b"?1" if value else b"?0"
+    if isinstance(value, int):
+        return b"i" + str(value).encode()
+    if isinstance(value, float):
+        return b"f" + repr(value).encode()
+    if value is None:
+        return b"n"
+    # Containers and other objects: canonical JSON (sorted keys)
+    try:
+        return b"j" + _KEY_ENCODER.encode(value)
+    except TypeError:
+        return b"J" + orjson.dumps(value, default=str, option=_KEY_JSON_OPTIONS)
+
+
 def generate_cache_key(prefix: str, *args: Any, **kwargs: Any) -> str:
     """
     Generate a deterministic cache key from function arguments.
-    Uses xxhash for ultra-fast non-cryptographic hashing.
+    Arguments are streamed into an incremental xxh3_64 hash, with no
+    intermediate JSON string for scalar arguments.
 
     Args:
         prefix: Key prefix (typically function name)
@@ -134,20 +265,25 @@ def generate_cache_key(prefix: str, *args: Any, **kwargs: Any) -> str:
     Returns:
         xxhash-based cache key (10x faster than SHA256)
     """
-    # Create a deterministic string representation
-    key_data = {
-        "args": args,
-        "kwargs": sorted(kwargs.items()),  # Sort for determinism
-    }
-    key_string = json.dumps(key_data, sort_keys=True, default=str)
-    # Use xxhash64 for speed (non-cryptographic but perfect for cache keys)
-    key_hash = xxhash.xxh64(key_string.encode()).hexdigest()[:16]
+    h = xxhash.xxh3_64()
+    for arg in args:
+        h.update(_encode_key_part(arg))
+        h.update(b"\x00")
+    # Sort for determinism
+    for name, value in sorted(kwargs.items()):
+        h.update(b"k" + name.encode())
+        h.update(_encode_key_part(value))
+        h.update(b"\x00")
 
-    return f"{prefix}:{key_hash}"
+    return f"{prefix}:{h.hexdigest()}"
 
 
 def valkey_cache(
-    ttl: int = 300, key_prefix: str | None = None
+    ttl: int = 300,
+    key_prefix: str | None = None,
+    serializer: Serializer | None = None,
+    return_metadata: bool = True,
+    raw_response: bool = False,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
     Generic Valkey cache decorator with timing instrumentation.
@@ -169,6 +305,12 @@ def valkey_cache(
     Args:
         ttl: Time-to-live in seconds (default: 300)
         key_prefix: Custom key prefix (default: function name)
+        serializer: Value serializer (default: the cache's, orjson); not allowed
+                    with raw_response, which always caches JSON bytes
+        return_metadata: If False, return the bare result (no timing, no wrapper dict)
+        raw_response: If True, cache the result as JSON bytes and return a JSON
+                      `Response` whose body splices those bytes into the metadata
+                      envelope, so hits are never decoded or re-encoded
 
     Returns:
         Dictionary with:
@@ -176,11 +318,16 @@ def valkey_cache(
             - cache_hit: Boolean indicating cache hit/miss
             - cache_time_ms: Time spent checking cache
             - source: "valkey" or function source
+        or just the result when return_metadata=False,
+        or that same dictionary as a pre-encoded JSON Response when raw_response=True
     """
 
+    if raw_response and serializer is not None:
+        raise ValueError("valkey_cache: serializer cannot be combined with raw_response")
+
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
             cache = get_valkey_cache()
             prefix = key_prefix or func.__name__
 
@@ -188,9 +335,21 @@ def valkey_cache(
             cache_key = generate_cache_key(prefix, *args, **kwargs)
 
             # Try to get from cache
-            cache_start = time.perf_counter()
-            cached_result = await cache.get(cache_key)
-            cache_time = (time.perf_counter() - cache_start) * 1000
+            if raw_response:
+                return await _raw_lookup(cache, cache_key, args, kwargs)
+
+            if not return_metadata:
+                cached_result = await cache.get(cache_key, serializer)
+                if cached_result is not None:
+                    return cached_result
+                with tracer.start_as_current_span(f"{func.__name__}_cache_miss"):
+                    result = await func(*args, **kwargs)
+                await cache.set(cache_key, result, ttl, serializer)
+                return result
+
+            cache_start = time.perf_counter_ns()
+            cached_result = await cache.get(cache_key, serializer)
+            cache_time = (time.perf_counter_ns() - cache_start) / 1_000_000
 
             if cached_result is not None:
                 # Cache hit
@@ -205,8 +364,8 @@ def valkey_cache(
             with tracer.start_as_current_span(f"{func.__name__}_cache_miss"):
                 result = await func(*args, **kwargs)
 
-            # Store in cache asynchronously (don't wait)
-            asyncio.create_task(cache.set(cache_key, result, ttl))
+            # Store in cache (queued for the background writer, doesn't wait on Valkey)
+            await cache.set(cache_key, result, ttl, serializer)
 
             return {
                 "data": result,
@@ -215,9 +374,45 @@ def valkey_cache(
                 "source": "duckdb",  # or whatever the actual source is
             }
 
+        async def _raw_lookup(
+            cache: ValkeyCache, cache_key: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+        ) -> Response:
+            cache_start = time.perf_counter_ns()
+            blob = await cache.get_raw(cache_key)
+            cache_time = (time.perf_counter_ns() - cache_start) / 1_000_000
+
+            if blob is not None:
+                return _json_envelope(blob, True, cache_time, "valkey")
+
+            with tracer.start_as_current_span(f"{func.__name__}_cache_miss"):
+                result = await func(*args, **kwargs)
+
+            # Encode once: the same bytes are the cache value and the response payload
+            blob = orjson.dumps(result)
+            await cache.set_raw(cache_key, blob, ttl)
+            return _json_envelope(blob, False, cache_time, "duckdb")
+
         return wrapper
 
     return decorator
 
 
+def _json_envelope(blob: bytes, cache_hit: bool, cache_time_ms: float, source: str) -> Response:
+    """JSON Response of the decorator's metadata dict with `blob` spliced in as "data"."""
+    body = b"".join(
+        (
+            b'{"data":',
+            blob,
+            b',"cache_hit":',
+            b"true" if cache_hit else b"false",
+            b',"cache_time_ms":',
+            orjson.dumps(cache_time_ms),
+            b',"source":"',
+            source.encode(),
+            b'"}',
+        )
+    )
+    return Response(content=body, media_type="application/json")
+
+
 # Alias for backward compatibility and internal usage
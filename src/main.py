@@ -1,50 +1,79 @@
-from collections.abc import AsyncGenerator
+import asyncio
+import time
+from collections.abc import AsyncGenerator, Awaitable
 from contextlib import asynccontextmanager
 from typing import Any
 
+import orjson
 from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
 
-from src.lib.logger import get_logger
+from src.lib.logger import configure_structlog, get_logger, stop_logging
 
+# Configure logging once, before tracing and the rest of the app are set up
+configure_structlog()
 logger = get_logger(__name__)
 
 
+class FastORJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse with numpy arrays serialized natively (no list copy),
+    datetimes emitted natively (naive ones treated as UTC, UTC as "Z"),
+    and non-str dict keys (e.g. int) allowed.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NAIVE_UTC
+            | orjson.OPT_UTC_Z
+            | orjson.OPT_NON_STR_KEYS,
+        )
+
+
 # =============================================================================
 # Application Lifespan & Setup
 # =============================================================================
 
 
+async def _timed_step(event: str, step: Awaitable[Any], **fields: Any) -> None:
+    """Await one startup step and log its completion with its own duration."""
+    start = time.perf_counter()
+    await step
+    logger.info(event, duration_ms=round((time.perf_counter() - start) * 1000, 2), **fields)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application startup and shutdown lifecycle."""
     logger.info("application_startup", stage="starting")
 
-    # Initialize Valkey cache
-    from src.lib.valkey_cache import init_valkey_cache
-
-    await init_valkey_cache()
-    logger.info("valkey_initialized")
-
-    # Initialize DuckDB connection pool
     from src.lib.duckdb_client import init_pool
-
-    init_pool(database=":memory:", pool_size=20)
-    logger.info("duckdb_pool_initialized", database=":memory:", pool_size=20)
-
-    # Initialize Search Index (for samples)
-    import asyncio
-
+    from src.lib.postgres_client import init_postgres
+    from src.lib.valkey_cache import init_valkey_cache
     from src.samples.extras import SearchEngine
+    from src.samples.services import get_large_json_bodies
 
+    # Independent init steps run concurrently: startup takes max(t_i) instead of sum(t_i)
     logger.info("search_index_seeding", documents=10000)
-    await asyncio.to_thread(SearchEngine.get_instance().seed, 10000)
-    logger.info("search_index_ready")
-    # Initialize PostgreSQL
-    from src.lib.postgres_client import init_postgres
-
-    await init_postgres()
-    logger.info("postgres_initialized")
+    await asyncio.gather(
+        # Valkey cache
+        _timed_step("valkey_initialized", init_valkey_cache()),
+        # DuckDB connection pool (sync: extension loading runs in a thread)
+        _timed_step(
+            "duckdb_pool_initialized",
+            asyncio.to_thread(init_pool, database=":memory:", pool_size=20),
+            database=":memory:",
+            pool_size=20,
+        ),
+        # Search Index (for samples)
+        _timed_step("search_index_ready", SearchEngine.get_instance().seed_in_process(10000)),
+        # Pre-encoded /samples/large-json body
+        _timed_step("large_json_cached", get_large_json_bodies()),
+        # PostgreSQL
+        _timed_step("postgres_initialized", init_postgres()),
+    )
 
     yield
 
@@ -54,7 +83,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     await get_valkey_cache().close()
     await get_postgres().close()
+    SearchEngine.get_instance().close()
     logger.info("application_shutdown", stage="cleanup_complete")
+    stop_logging()
 
 
 # =============================================================================
@@ -67,7 +98,7 @@ from src.middleware.telemetry import init_tracing, instrument_fastapi  # noqa: E
 init_tracing()
 
 app: FastAPI = FastAPI(
-    title="Performant Python Demo", default_response_class=ORJSONResponse, lifespan=lifespan
+    title="Performant Python Demo", default_response_class=FastORJSONResponse, lifespan=lifespan
 )
 
 # Instrument for tracing
@@ -171,13 +202,18 @@ async def hr_employees(request: Request) -> dict[str, Any]:
 
 if __name__ == "__main__":
     from granian import Granian
-    from granian.constants import Interfaces
+    from granian.constants import Interfaces, RuntimeModes
+
+    # One process per core; each worker builds its own DuckDB/Postgres/Valkey pools
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
 
-    print("Starting Granian server...")
+    print(f"Starting Granian server with {workers} workers...")
     Granian(
         target="src.main:app",
         address="0.0.0.0",  # nosec B104
         port=8080,
         interface=Interfaces.ASGI,
-        workers=1,
+        workers=workers,
+        # Single-threaded runtime per worker process: scale out with processes
+        runtime_mode=RuntimeModes.st,
     ).serve()
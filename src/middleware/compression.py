@@ -3,14 +3,72 @@ Compression middleware using zstandard for FastAPI.
 Provides better compression ratios and speed compared to gzip.
 """
 
+import asyncio
+from collections import deque
+from typing import Any
+
 import zstandard as zstd
-from starlette.datastructures import Headers, MutableHeaders
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.lib.logger import get_logger
 
 logger = get_logger(__name__)
 
+# ASGI header names are lower-case bytes: compare raw tuples directly instead of
+# building (and re-normalizing) Headers/MutableHeaders on every response
+_ACCEPT_ENCODING = b"accept-encoding"
+_CONTENT_ENCODING = b"content-encoding"
+_CONTENT_LENGTH = b"content-length"
+_VARY = b"vary"
+
+# One-shot bodies at or above this size use zstd's multi-threaded compression
+# off the event loop (nbWorkers splits the frame across cores)
+LARGE_RESPONSE_SIZE = 256 * 1024
+
+
+def accepts_zstd(accept_encoding: bytes) -> bool:
+    """Whether an Accept-Encoding value lists zstd with a non-zero q-value."""
+    accept_encoding = accept_encoding.lower()
+    if b"zstd" not in accept_encoding:
+        return False
+    for item in accept_encoding.split(b","):
+        coding, _, params = item.partition(b";")
+        if coding.strip() == b"zstd":
+            return _qvalue(params) > 0
+    return False
+
+
+def _qvalue(params: bytes) -> float:
+    """q parameter of one Accept-Encoding item (1 when absent, 0 when malformed)."""
+    for param in params.split(b";"):
+        name, _, value = param.partition(b"=")
+        if name.strip() == b"q":
+            try:
+                return float(value.strip())
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+class CompressorPool:
+    """
+    Free-list of ZstdCompressors. A compressor (and any compressobj made from it)
+    is used by one holder at a time; deque append/pop are atomic, so no lock is needed.
+    """
+
+    def __init__(self, **params: Any) -> None:
+        self._params = params
+        self._free: deque[zstd.ZstdCompressor] = deque()
+
+    def acquire(self) -> zstd.ZstdCompressor:
+        try:
+            return self._free.pop()
+        except IndexError:
+            return zstd.ZstdCompressor(**self._params)
+
+    def release(self, compressor: zstd.ZstdCompressor) -> None:
+        self._free.append(compressor)
+
 
 class ZstdMiddleware:
     """
@@ -34,7 +92,13 @@ class ZstdMiddleware:
     ) -> None:
         self.app = app
         self.minimum_size = minimum_size
-        self.compressor = zstd.ZstdCompressor(level=compression_level)
+        # Small bodies: single-threaded, used inline on the event loop
+        self.compressor = zstd.ZstdCompressor(level=compression_level, write_content_size=True)
+        # Large bodies (compressed in a worker thread) and streamed bodies
+        self.large_pool = CompressorPool(
+            level=compression_level, threads=-1, write_content_size=True
+        )
+        self.stream_pool = CompressorPool(level=compression_level)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":
@@ -42,35 +106,56 @@ class ZstdMiddleware:
             return
 
         # Check if client accepts zstd
-        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        accept_encoding = b""
+        for name, value in scope["headers"]:
+            if name == _ACCEPT_ENCODING:
+                accept_encoding = value
+                break
 
-        if "zstd" not in accept_encoding.lower():
-            # Client doesn't support zstd, pass through
+        if not accepts_zstd(accept_encoding):
+            # Client doesn't support zstd (or refuses it with q=0), pass through
             await self.app(scope, receive, send)
             return
 
         # Intercept response
-        responder = ZstdResponder(self.app, self.compressor, self.minimum_size)
+        responder = ZstdResponder(
+            self.app, self.compressor, self.minimum_size, self.large_pool, self.stream_pool
+        )
         await responder(scope, receive, send)
 
 
 class ZstdResponder:
-    """Handles the actual compression of responses."""
+    """
+    Handles the actual compression of responses.
+
+    Single-message bodies are compressed in one shot: inline with the shared
+    compressor, or in a worker thread with a multi-threaded one when large.
+    Streamed bodies buffer at most `minimum_size` bytes to decide, then each chunk
+    is compressed and forwarded as it arrives (no content-length, chunked transfer).
+    """
 
     def __init__(
         self,
         app: ASGIApp,
         compressor: zstd.ZstdCompressor,
         minimum_size: int,
+        large_pool: CompressorPool,
+        stream_pool: CompressorPool,
     ) -> None:
         self.app = app
         self.compressor = compressor
         self.minimum_size = minimum_size
+        self.large_pool = large_pool
+        self.stream_pool = stream_pool
+        self.stream_compressor: zstd.ZstdCompressor | None = None
         self.send: Send = None  # type: ignore
         self.initial_message: Message = {}
         self.started = False
-        self.content_length = 0
-        self.buffer = bytearray()
+        self.passthrough = False
+        self.pending = b""
+        self.stream: zstd.ZstdCompressionObj | None = None
+        self.original_size = 0
+        self.compressed_size = 0
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         self.send = send
@@ -82,58 +167,124 @@ class ZstdResponder:
         if message_type == "http.response.start":
             # Store the initial message, don't send yet
             self.initial_message = message
-            headers = MutableHeaders(raw=list(message["headers"]))
-
-            # Get content length if available
-            if "content-length" in headers:
-                self.content_length = int(headers["content-length"])
-
-        elif message_type == "http.response.body":
-            # Accumulate body
-            body = message.get("body", b"")
-            if body:
-                self.buffer.extend(body)
-
-            # Check if this is the last chunk
-            if not message.get("more_body", False):
-                # All body received, decide whether to compress
-                headers = MutableHeaders(raw=list(self.initial_message["headers"]))
-
-                # Don't compress if already compressed or too small
-                if "content-encoding" in headers or len(self.buffer) < self.minimum_size:
-                    # Send original response
-                    await self.send(self.initial_message)
-                    await self.send({"type": "http.response.body", "body": bytes(self.buffer)})
-                else:
-                    # Compress and send
-                    original_size = len(self.buffer)
-                    compressed = self.compressor.compress(bytes(self.buffer))
-                    compressed_size = len(compressed)
-                    compression_ratio = (
-                        (1 - compressed_size / original_size) * 100 if original_size > 0 else 0
-                    )
-
-                    # Log compression metrics
-                    logger.debug(
-                        "response_compressed",
-                        original_size=original_size,
-                        compressed_size=compressed_size,
-                        compression_ratio_percent=round(compression_ratio, 2),
-                    )
-
-                    # Update headers
-                    headers["content-encoding"] = "zstd"
-                    headers["content-length"] = str(compressed_size)
-                    if "vary" in headers:
-                        headers["vary"] = headers["vary"] + ", Accept-Encoding"
-                    else:
-                        headers["vary"] = "Accept-Encoding"
-
-                    # Remove any existing content-length
-                    self.initial_message["headers"] = headers.raw
-
-                    # Send compressed response
-                    await self.send(self.initial_message)
-                    await self.send({"type": "http.response.body", "body": compressed})
-                    await self.send(self.initial_message)
-                    await self.send({"type": "http.response.body", "body": compressed})
+            # Already encoded upstream - forward untouched
+            self.passthrough = any(name == _CONTENT_ENCODING for name, _ in message["headers"])
+            return
+
+        if message_type != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.passthrough:
+            if not self.started:
+                self.started = True
+                await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        if self.stream is not None:
+            await self._send_compressed_chunk(self.stream, body, more_body)
+            return
+
+        # Still deciding: hold back at most minimum_size bytes
+        if self.pending:
+            body = self.pending + body
+            self.pending = b""
+
+        if not more_body:
+            if len(body) < self.minimum_size:
+                # Send original response
+                self.started = True
+                await self.send(self.initial_message)
+                await self.send({"type": "http.response.body", "body": body})
+                return
+
+            # Whole body in one message: one-shot compression
+            compressed = await self._compress(body)
+            self.original_size = len(body)
+            self.compressed_size = len(compressed)
+            self._set_compressed_headers(content_length=len(compressed))
+            self.started = True
+            await self.send(self.initial_message)
+            await self.send({"type": "http.response.body", "body": compressed})
+            self._log_metrics()
+            return
+
+        if len(body) < self.minimum_size:
+            self.pending = body
+            return
+
+        # Streaming: a pooled compressor per response (compression objects share
+        # their compressor's context, so concurrent streams can't share one)
+        self.stream_compressor = self.stream_pool.acquire()
+        self.stream = self.stream_compressor.compressobj()
+        self._set_compressed_headers(content_length=None)
+        self.started = True
+        await self.send(self.initial_message)
+        await self._send_compressed_chunk(self.stream, body, more_body)
+
+    async def _send_compressed_chunk(
+        self, stream: "zstd.ZstdCompressionObj", body: bytes, more_body: bool
+    ) -> None:
+        self.original_size += len(body)
+        out = stream.compress(body)
+        if more_body:
+            # Flush a block so streamed chunks reach the client without waiting
+            out += stream.flush(zstd.COMPRESSOBJ_FLUSH_BLOCK)
+        else:
+            out += stream.flush(zstd.COMPRESSOBJ_FLUSH_FINISH)
+        self.compressed_size += len(out)
+        await self.send({"type": "http.response.body", "body": out, "more_body": more_body})
+        if not more_body:
+            # Frame finished: the compressor is clean again. A response that dies
+            # mid-stream never gets here, so a half-used context is never reused.
+            if self.stream_compressor is not None:
+                self.stream_pool.release(self.stream_compressor)
+                self.stream_compressor = None
+            self._log_metrics()
+
+    async def _compress(self, body: bytes) -> bytes:
+        if len(body) < LARGE_RESPONSE_SIZE:
+            return self.compressor.compress(body)
+
+        compressor = self.large_pool.acquire()
+        try:
+            return await asyncio.to_thread(compressor.compress, body)
+        finally:
+            self.large_pool.release(compressor)
+
+    def _set_compressed_headers(self, content_length: int | None) -> None:
+        headers = []
+        vary = b""
+        for name, value in self.initial_message["headers"]:
+            if name == _VARY:
+                vary = value
+            elif name != _CONTENT_LENGTH:
+                headers.append((name, value))
+
+        headers.append((_CONTENT_ENCODING, b"zstd"))
+        # Length unknown up front (streaming) - omit it for chunked transfer
+        if content_length is not None:
+            headers.append((_CONTENT_LENGTH, str(content_length).encode()))
+        if not vary:
+            vary = b"Accept-Encoding"
+        elif b"accept-encoding" not in (token.strip() for token in vary.lower().split(b",")):
+            vary += b", Accept-Encoding"
+        headers.append((_VARY, vary))
+        self.initial_message["headers"] = headers
+
+    def _log_metrics(self) -> None:
+        compression_ratio = (
+            (1 - self.compressed_size / self.original_size) * 100 if self.original_size > 0 else 0
+        )
+
+        # Log compression metrics
+        logger.debug(
+            "response_compressed",
+            original_size=self.original_size,
+            compressed_size=self.compressed_size,
+            compression_ratio_percent=round(compression_ratio, 2),
+        )
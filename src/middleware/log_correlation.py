@@ -1,44 +1,87 @@
-import uuid
-from collections.abc import Awaitable, Callable
+import os
+import threading
 from contextvars import ContextVar
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # ContextVar to store the request ID for valid access across async context
 # Defaults to None
 request_id_ctx: ContextVar[str | None] = ContextVar("request_id", default=None)
 
+# Request IDs are sliced from a per-thread buffer of random bytes, refilled
+# 4 KiB (256 IDs) at a time, instead of building a uuid.UUID per request.
+_RAND_CHUNK = 4096
+_rand = threading.local()
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
+
+def _reset_rand() -> None:
+    # A forked child must not hand out the parent's remaining buffered bytes
+    global _rand
+    _rand = threading.local()
+
+
+os.register_at_fork(after_in_child=_reset_rand)
+
+
+def new_request_id() -> str:
+    """128 random bits as 32 hex chars (same entropy as uuid4, no UUID object)."""
+    rand = _rand
+    try:
+        buf, off = rand.buf, rand.off
+    except AttributeError:
+        buf, off = b"", _RAND_CHUNK
+    if off >= _RAND_CHUNK:
+        buf, off = os.urandom(_RAND_CHUNK), 0
+        rand.buf = buf
+    rand.off = off + 16
+    return buf[off : off + 16].hex()
+
+
+class RequestIdMiddleware:
     """
     Middleware that ensures every request has a unique ID.
 
     1. Checks for X-Request-ID header.
-    2. If missing, generates a new UUID.
+    2. If missing, generates a new random ID.
     3. Stores it in a ContextVar for logging.
     4. Adds it to the response headers.
+
+    Pure ASGI (like ZstdMiddleware): no BaseHTTPMiddleware task group or
+    memory stream per request.
     """
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # 1. Get or generate ID
-        req_id = request.headers.get("X-Request-ID")
+        req_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                req_id = value.decode("latin-1")
+                break
         if not req_id:
-            req_id = str(uuid.uuid4())
+            req_id = new_request_id()
+        header = (b"x-request-id", req_id.encode("latin-1"))
 
-        # 2. Set ContextVar
+        async def send_with_request_id(message: Message) -> None:
+            # 4. Add to Response
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), header]
+            await send(message)
+
+        # 2. Set ContextVar. This stays per request: structlog processors get no
+        # scope, and to_thread workers only inherit the context, so it is the one
+        # channel add_request_id can read (set/reset is a cheap HAMT update)
         token = request_id_ctx.set(req_id)
 
         try:
             # 3. Process Request
-            response = await call_next(request)
-
-            # 4. Add to Response
-            response.headers["X-Request-ID"] = req_id
-            return response
+            await self.app(scope, receive, send_with_request_id)
 
         finally:
             # Cleanup ContextVar
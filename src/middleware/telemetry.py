@@ -5,6 +5,7 @@ Only initialized when ENABLE_TRACING=true.
 
 import os
 
+import grpc
 from fastapi import FastAPI
 from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
@@ -12,15 +13,19 @@ from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
 
 from src.lib.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Read once at import; hot paths check this instead of creating no-op spans
+TRACING_ENABLED = os.getenv("ENABLE_TRACING", "false").lower() == "true"
+
 
 def init_tracing() -> bool:
     """Initialize OpenTelemetry tracing if ENABLE_TRACING is true."""
-    if os.getenv("ENABLE_TRACING", "false").lower() != "true":
+    if not TRACING_ENABLED:
         logger.info("tracing_disabled", message="Skipping OpenTelemetry initialization")
         return False
 
@@ -33,13 +38,31 @@ def init_tracing() -> bool:
         }
     )
 
+    # Head sampling: keep a ratio of new traces (default 10%), follow the parent otherwise.
+    # Unsampled spans are non-recording, so span events/attributes are skipped for them.
+    sample_ratio = float(os.getenv("OTEL_TRACES_SAMPLER_ARG", "0.1"))
+
     # Create tracer provider
-    provider = TracerProvider(resource=resource)
+    provider = TracerProvider(
+        resource=resource, sampler=ParentBased(TraceIdRatioBased(sample_ratio))
+    )
 
     # Add OTLP exporter
     otlp_endpoint = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://jaeger:4317")
-    otlp_exporter = OTLPSpanExporter(endpoint=otlp_endpoint, insecure=True)
-    provider.add_span_processor(BatchSpanProcessor(otlp_exporter))
+    otlp_exporter = OTLPSpanExporter(
+        endpoint=otlp_endpoint, insecure=True, compression=grpc.Compression.Gzip, timeout=10
+    )
+    # Spans are handed to the exporter thread via a queue; a deeper queue and
+    # shorter delay keep bursts from filling it (on_end drops rather than blocks)
+    provider.add_span_processor(
+        BatchSpanProcessor(
+            otlp_exporter,
+            max_queue_size=8192,
+            max_export_batch_size=1024,
+            schedule_delay_millis=2000,
+            export_timeout_millis=30000,
+        )
+    )
 
     # Set as global tracer provider
     trace.set_tracer_provider(provider)
@@ -47,6 +70,7 @@ def init_tracing() -> bool:
     logger.info(
         "tracing_initialized",
         endpoint=otlp_endpoint,
+        sample_ratio=sample_ratio,
         service_name=os.getenv("OTEL_SERVICE_NAME", "performant-python"),
     )
     return True
@@ -54,6 +78,6 @@ def init_tracing() -> bool:
 
 def instrument_fastapi(app: FastAPI) -> None:
     """Instrument FastAPI app if tracing is enabled."""
-    if os.getenv("ENABLE_TRACING", "false").lower() == "true":
+    if TRACING_ENABLED:
         FastAPIInstrumentor.instrument_app(app)
         logger.info("fastapi_instrumented", message="FastAPI instrumented for tracing")
@@ -1,13 +1,23 @@
+import asyncio
+import multiprocessing
+import queue
+import shutil
+import tempfile
 import time
+from concurrent.futures import ProcessPoolExecutor
 from functools import lru_cache
 from typing import Any, cast
 
+import msgspec
 import tantivy
 from minijinja import Environment
 from opentelemetry import trace
 
 tracer = trace.get_tracer("performant-python.extras")
 
+# Searchers kept resident so /search never pays the cold-open cost
+SEARCHER_POOL_SIZE = 4
+
 # --- MiniJinja Setup (Templating) ---
 jinja_env = Environment()
 jinja_env.add_template(
@@ -41,21 +51,71 @@ def render_report(context: dict[str, Any]) -> str:
     return jinja_env.render_template("report.html", **context)  # type: ignore[no-any-return]
 
 
+def render_report_from_struct(stats: msgspec.Struct) -> str:
+    """
+    Renders the report from a msgspec struct.
+    msgspec.to_builtins builds the template context in C (no per-field Python walk).
+    """
+    return render_report(msgspec.to_builtins(stats))
+
+
 # --- Tantivy Setup (Search) ---
+def _build_schema() -> tantivy.Schema:
+    schema_builder = tantivy.SchemaBuilder()
+    schema_builder.add_text_field("title", stored=True)
+    schema_builder.add_text_field("body", stored=True)
+    schema_builder.add_integer_field("id", stored=True)
+    return schema_builder.build()
+
+
+def _add_seed_documents(writer: tantivy.IndexWriter, size: int) -> None:
+    for i in range(size):
+        title = f"Doc {i} - Performance Optimization"
+        body = (
+            f"This is the body of document {i}. "
+            f"It mentions Rust, Python, and Speed. The number is {i}."
+        )
+        if i % 2 == 0:
+            body += " It also talks about Databases."
+
+        doc = tantivy.Document()
+        doc.add_text("title", title)
+        doc.add_text("body", body)
+        doc.add_unsigned("id", i)
+        writer.add_document(doc)
+
+
+def build_index_on_disk(path: str, size: int) -> None:
+    """
+    Builds and commits a seeded index under `path`.
+    Runs in a worker process (module-level so it can be pickled).
+    """
+    index = tantivy.Index(_build_schema(), path=path)
+    writer = index.writer()
+    _add_seed_documents(writer, size)
+    writer.commit()
+    writer.wait_merging_threads()
+
+
 class SearchEngine:
     _instance = None
 
     def __init__(self) -> None:
         # We create an in-memory index for demonstration
-        schema_builder = tantivy.SchemaBuilder()
-        schema_builder.add_text_field("title", stored=True)
-        schema_builder.add_text_field("body", stored=True)
-        schema_builder.add_integer_field("id", stored=True)
-        self.schema = schema_builder.build()
+        self.schema = _build_schema()
 
         # Create index in RAM
         self.index = tantivy.Index(self.schema)
-        self.writer = self.index.writer()
+        self._writer: tantivy.IndexWriter | None = None
+        self.index_dir: str | None = None
+        self._searchers: queue.SimpleQueue[tantivy.Searcher] = queue.SimpleQueue()
+
+    @property
+    def writer(self) -> tantivy.IndexWriter:
+        # Created on first use: an index opened from disk is read-only here
+        if self._writer is None:
+            self._writer = self.index.writer()
+        return self._writer
 
     @classmethod
     def get_instance(cls) -> "SearchEngine":
@@ -70,52 +130,96 @@ class SearchEngine:
         """
         print(f"Indexing {size} documents into Tantivy...")
         start = time.time()
-        for i in range(size):
-            title = f"Doc {i} - Performance Optimization"
-            body = (
-                f"This is the body of document {i}. "
-                f"It mentions Rust, Python, and Speed. The number is {i}."
-            )
-            if i % 2 == 0:
-                body += " It also talks about Databases."
-
-            doc = tantivy.Document()
-            doc.add_text("title", title)
-            doc.add_text("body", body)
-            doc.add_unsigned("id", i)
-            self.writer.add_document(doc)
+        _add_seed_documents(self.writer, size)
 
         with tracer.start_as_current_span("tantivy_commit"):
             self.writer.commit()
 
-        # Index is now ready for searching (searcher created on-demand in search method)
+        # Index is now ready for searching: warm searchers over the new commit
+        self.warm_pool()
         print(f"Indexing complete in {time.time() - start:.4f}s")
 
+    def warm_pool(self, size: int = SEARCHER_POOL_SIZE) -> None:
+        """
+        Replace the searcher pool with `size` searchers over the latest commit.
+        Searchers are snapshots, so this runs again whenever the index changes.
+        """
+        self.index.reload()
+        searchers: queue.SimpleQueue[tantivy.Searcher] = queue.SimpleQueue()
+        for _ in range(size):
+            searchers.put(self.index.searcher())
+        self._searchers = searchers
+
+    def open_index(self, path: str) -> None:
+        """Switch to a pre-built on-disk index (see `build_index_on_disk`)."""
+        self.index = tantivy.Index.open(path)
+        self.index.reload()
+        self._writer = None
+        self.index_dir = path
+        self.warm_pool()
+        self.search.cache_clear()
+
+    async def seed_in_process(self, size: int = 10000) -> None:
+        """
+        Builds the seeded index in a spawned worker process (off the GIL, off the
+        event loop) and opens it here. Falls back to seeding in a thread.
+        """
+        index_dir = tempfile.mkdtemp(prefix="tantivy-index-")
+        loop = asyncio.get_running_loop()
+        try:
+            with ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                await loop.run_in_executor(executor, build_index_on_disk, index_dir, size)
+            await asyncio.to_thread(self.open_index, index_dir)
+        except Exception as e:
+            print(f"Process-based index build failed ({e}); seeding in a thread instead.")
+            shutil.rmtree(index_dir, ignore_errors=True)
+            await asyncio.to_thread(self.seed, size)
+
+    def close(self) -> None:
+        """Remove the on-disk index directory, if any."""
+        if self.index_dir:
+            shutil.rmtree(self.index_dir, ignore_errors=True)
+            self.index_dir = None
+
     @lru_cache(maxsize=256)  # noqa: B019
     @tracer.start_as_current_span("search")
     def search(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
         """
         Searches the index using Tantivy (Rust).
         Cached for performance - repeated searches return instantly.
+        Borrows a searcher from the warm pool (a throwaway one if all are in use).
         """
-        with tracer.start_as_current_span("tantivy_execute_search"):
+        searchers = self._searchers
+        try:
+            searcher = searchers.get_nowait()
+            pooled = True
+        except queue.Empty:
             searcher = self.index.searcher()
-            # Tantivy 0.22+ API: parse_query is now a method on Index
-            query_obj = self.index.parse_query(query, ["title", "body"])
-
-            top_docs = searcher.search(query_obj, limit).hits
-
-        results = []
-        for _, doc_address in top_docs:
-            retrieved_doc = searcher.doc(doc_address)
-            # Cast to dict behavior or Any to bypass MyPy checks on native object
-            doc_any = cast(Any, retrieved_doc)
-            results.append(
-                {
-                    "id": doc_any["id"][0],
-                    "title": doc_any.get("title", [""])[0],
-                    "body": doc_any.get("body", [""])[0][:200],  # truncate
-                }
-            )
+            pooled = False
+
+        try:
+            with tracer.start_as_current_span("tantivy_execute_search"):
+                # Tantivy 0.22+ API: parse_query is now a method on Index
+                query_obj = self.index.parse_query(query, ["title", "body"])
+
+                top_docs = searcher.search(query_obj, limit).hits
+
+            results = []
+            for _, doc_address in top_docs:
+                retrieved_doc = searcher.doc(doc_address)
+                # Cast to dict behavior or Any to bypass MyPy checks on native object
+                doc_any = cast(Any, retrieved_doc)
+                results.append(
+                    {
+                        "id": doc_any["id"][0],
+                        "title": doc_any.get("title", [""])[0],
+                        "body": doc_any.get("body", [""])[0][:200],  # truncate
+                    }
+                )
+        finally:
+            if pooled:
+                searchers.put(searcher)
 
         return results
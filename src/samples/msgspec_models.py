@@ -1,19 +1,26 @@
-from typing import Any
+import time
+from datetime import datetime
+from typing import Annotated, Any
 
 import msgspec
 
+# Field constraints shared by the row and columnar batch models (mirror DataPoint)
+Category = Annotated[str, msgspec.Meta(pattern=r"^[A-Z]+$")]
+Value = Annotated[float, msgspec.Meta(ge=0.0, le=1000.0)]
+
 
 class FastDataPoint(msgspec.Struct):
     """
     Equivalent to DataPoint but using msgspec.Struct.
     msgspec structs are defined as C structures and are faster to instantiate and validate.
+    Constraints mirror DataPoint (category pattern, value range, defaults).
     """
 
     id: int
-    timestamp: float
-    category: str
-    value: float
-    tags: list[str]
+    category: Category
+    value: Value
+    timestamp: float = msgspec.field(default_factory=time.time)
+    tags: list[str] = msgspec.field(default_factory=list)
 
 
 class FastBatchData(msgspec.Struct):
@@ -25,6 +32,30 @@ class FastBatchData(msgspec.Struct):
     data: list[FastDataPoint]
 
 
+class FastBatchDataColumnar(msgspec.Struct):
+    """
+    Columnar (struct-of-arrays) variant of FastBatchData.
+    One list per field instead of one object per row, so a batch decodes into
+    a handful of lists that map directly onto Arrow arrays.
+    Elements carry FastDataPoint's constraints, and all columns must have the
+    same length (checked while decoding, so ragged bodies are a ValidationError).
+    """
+
+    batch_id: str
+    ids: list[int]
+    timestamps: list[float]
+    categories: list[Category]
+    values: list[Value]
+    tags: list[list[str]]
+
+    def __post_init__(self) -> None:
+        n = len(self.ids)
+        if not (
+            len(self.timestamps) == len(self.categories) == len(self.values) == len(self.tags) == n
+        ):
+            raise ValueError("columns must all have the same length")
+
+
 class FastProcessingStats(msgspec.Struct):
     """
     Return type for msgspec endpoints.
@@ -39,6 +70,21 @@ class FastProcessingStats(msgspec.Struct):
     processing_speed_score: float
 
 
+class ProcessingStatsMsg(msgspec.Struct, kw_only=True):
+    """
+    msgspec mirror of ProcessingStats (same fields and defaults), for routes
+    that decode stats payloads without Pydantic.
+    """
+
+    batch_id: str
+    processed_at: datetime = msgspec.field(default_factory=datetime.now)
+    total_records: int
+    mean_value: float
+    max_value: float
+    by_category: dict[str, float]
+    processing_speed_score: float
+
+
 # =============================================================================
 # PostgreSQL Models (msgspec - faster than Pydantic)
 # =============================================================================
@@ -53,15 +99,20 @@ class UserEventMsg(msgspec.Struct):
     metadata: dict[str, Any]
 
 
-class UserEventResponseMsg(msgspec.Struct):
-    """User event response with ID and timestamp."""
+class UserEventResponseMsg(msgspec.Struct, gc=False):
+    """
+    User event response with ID and timestamp.
+    gc=False: instances only hold scalars and decoded JSON, never cycles, so
+    they can skip GC tracking (lists of thousands are built per request).
+    """
 
     id: int
     user_id: int
     event_type: str
     page_url: str
     metadata: dict[str, Any]
-    created_at: str  # ISO format datetime string
+    # Passed through as the driver's datetime; msgspec writes RFC 3339 like Pydantic did
+    created_at: datetime
 
 
 class AnalyticsSummaryMsg(msgspec.Struct):
@@ -75,6 +126,16 @@ class AnalyticsSummaryMsg(msgspec.Struct):
     source: str
 
 
+class ConversionFunnelMsg(msgspec.Struct, gc=False):
+    """Conversion funnel by page (msgspec)."""
+
+    page_url: str
+    page_views: int
+    clicks: int
+    conversions: int
+    conversion_rate: float
+
+
 class IcebergBenchmarkResult(msgspec.Struct):
     """
     Result of an Iceberg performance benchmark test (msgspec).
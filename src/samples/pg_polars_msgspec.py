@@ -3,15 +3,36 @@ Optimized PostgreSQL endpoints using msgspec + Polars.
 Demonstrates performance improvements over Pydantic + dict/list.
 """
 
-import json
 import time
 from typing import Any
 
 import msgspec
+import orjson
 import polars as pl
 
 from src.lib.postgres_client import get_postgres
 from src.samples.msgspec_models import UserEventResponseMsg
+from src.samples.pg_pydantic_dict import (
+    USER_EVENTS_QUERY,
+    USER_EVENTS_TEXT_QUERY,
+    get_user_events_endpoint,
+)
+
+# Columns of USER_EVENTS_QUERY, known up front so Polars never infers them.
+# metadata holds decoded dicts; USER_EVENTS_TEXT_QUERY returns it as text.
+USER_EVENTS_SCHEMA = {
+    "id": pl.Int64,
+    "user_id": pl.Int64,
+    "event_type": pl.Utf8,
+    "page_url": pl.Utf8,
+    "metadata": pl.Object,
+    "created_at": pl.Datetime("us"),
+}
+_USER_EVENTS_TEXT_SCHEMA = {**USER_EVENTS_SCHEMA, "metadata": pl.Utf8}
+
+# Encodes event structs straight to JSON bytes (no asdict() copies); the result
+# is embedded in the response as an orjson.Fragment
+_EVENTS_ENCODER = msgspec.json.Encoder()
 
 
 async def get_user_events_msgspec(user_id: int, limit: int = 100) -> dict[str, Any]:
@@ -21,35 +42,18 @@ async def get_user_events_msgspec(user_id: int, limit: int = 100) -> dict[str, A
     pg = get_postgres()
 
     t_query_start = time.perf_counter()
-    rows = await pg.fetch(
-        """
-        SELECT id, user_id, event_type, page_url, metadata, created_at
-        FROM user_events
-        WHERE user_id = $1
-        ORDER BY created_at DESC
-        LIMIT $2
-        """,
-        user_id,
-        limit,
-    )
+    rows = await pg.fetch(USER_EVENTS_QUERY, user_id, limit)
     t_query_end = time.perf_counter()
 
-    # Parse with msgspec (fast validation)
+    # Parse with msgspec (fast validation): one pass, structs built positionally
+    # from the records (column order matches USER_EVENTS_QUERY) - no dict per row
     t_parse_start = time.perf_counter()
-    events = []
-    for row in rows:
-        event_data = dict(row)
-        event_data["metadata"] = (
-            json.loads(event_data["metadata"])
-            if isinstance(event_data["metadata"], str)
-            else event_data["metadata"]
-        )
-        event_data["created_at"] = str(event_data["created_at"])
-        events.append(UserEventResponseMsg(**event_data))
+    events = [UserEventResponseMsg(r[0], r[1], r[2], r[3], r[4], r[5]) for r in rows]
+    encoded = orjson.Fragment(_EVENTS_ENCODER.encode(events))
     t_parse_end = time.perf_counter()
 
     return {
-        "events": [msgspec.structs.asdict(e) for e in events],
+        "events": encoded,
         "count": len(events),
         "query_time_ms": (t_query_end - t_query_start) * 1000,
         "parse_time_ms": (t_parse_end - t_parse_start) * 1000,
@@ -58,6 +62,35 @@ async def get_user_events_msgspec(user_id: int, limit: int = 100) -> dict[str, A
     }
 
 
+async def fetch_user_events_structs(user_id: int, limit: int = 100) -> list[UserEventResponseMsg]:
+    """
+    Fetch a user's events straight into msgspec structs, ready for
+    msgspec.json.Encoder - no Pydantic models or per-row dicts.
+    """
+    rows = await get_postgres().fetch(USER_EVENTS_QUERY, user_id, limit)
+    return [UserEventResponseMsg(r[0], r[1], r[2], r[3], r[4], r[5]) for r in rows]
+
+
+def events_json_array(df: pl.DataFrame) -> str:
+    """
+    JSON array text of user-event rows whose metadata column holds JSON text.
+    Rows are encoded natively by Polars and metadata is spliced in undecoded
+    (NULL metadata becomes JSON null).
+    """
+    if df.is_empty():
+        return "[]"
+    body = df.select(
+        pl.concat_str(
+            pl.struct(pl.exclude("metadata")).struct.json_encode().str.head(-1),
+            pl.lit(',"metadata":'),
+            # concat_str is null if any part is null, and str.join would then drop the row
+            pl.col("metadata").fill_null("null"),
+            pl.lit("}"),
+        ).str.join(",")
+    ).item()
+    return f"[{body}]"
+
+
 async def get_user_events_polars(user_id: int, limit: int = 100) -> dict[str, Any]:
     """
     Get user events with Polars DataFrame processing.
@@ -65,41 +98,21 @@ async def get_user_events_polars(user_id: int, limit: int = 100) -> dict[str, An
     pg = get_postgres()
 
     t_query_start = time.perf_counter()
-    rows = await pg.fetch(
-        """
-        SELECT id, user_id, event_type, page_url, metadata, created_at
-        FROM user_events
-        WHERE user_id = $1
-        ORDER BY created_at DESC
-        LIMIT $2
-        """,
-        user_id,
-        limit,
-    )
+    columns = await pg.fetch_columns(USER_EVENTS_TEXT_QUERY, user_id, limit)
     t_query_end = time.perf_counter()
 
-    # Convert to Polars DataFrame and process
+    # Convert to Polars DataFrame and encode the rows to JSON natively. metadata
+    # is fetched as JSON text, so it is spliced in undecoded.
     t_parse_start = time.perf_counter()
-    if rows:
-        # Convert asyncpg Records to dicts for Polars to preserve column names
-        df = pl.DataFrame([dict(row) for row in rows])
-
-        # Vectorized JSON parsing
-        df = df.with_columns(
-            pl.col("metadata").map_elements(
-                lambda x: json.loads(x) if isinstance(x, str) else x, return_dtype=pl.Object
-            ),
-            pl.col("created_at").cast(pl.Utf8),
-        )
-
-        events = df.to_dicts()
-    else:
-        events = []
+    df = pl.DataFrame(columns, schema=_USER_EVENTS_TEXT_SCHEMA)
+    count = len(df)
+    # Embedded as-is by orjson - no per-row dicts, no second encode pass
+    events = orjson.Fragment(events_json_array(df))
     t_parse_end = time.perf_counter()
 
     return {
         "events": events,
-        "count": len(events),
+        "count": count,
         "query_time_ms": (t_query_end - t_query_start) * 1000,
         "parse_time_ms": (t_parse_end - t_parse_start) * 1000,
         "total_time_ms": (t_parse_end - t_query_start) * 1000,
@@ -114,40 +127,25 @@ async def get_user_events_msgspec_polars(user_id: int, limit: int = 100) -> dict
     pg = get_postgres()
 
     t_query_start = time.perf_counter()
-    rows = await pg.fetch(
-        """
-        SELECT id, user_id, event_type, page_url, metadata, created_at
-        FROM user_events
-        WHERE user_id = $1
-        ORDER BY created_at DESC
-        LIMIT $2
-        """,
-        user_id,
-        limit,
-    )
+    columns = await pg.fetch_columns(USER_EVENTS_QUERY, user_id, limit)
     t_query_end = time.perf_counter()
 
     # Polars DataFrame + msgspec validation
     t_parse_start = time.perf_counter()
-    if rows:
-        # Convert asyncpg Records to dicts for Polars to preserve column names
-        df = pl.DataFrame([dict(row) for row in rows])
-        df = df.with_columns(
-            pl.col("metadata").map_elements(
-                lambda x: json.loads(x) if isinstance(x, str) else x, return_dtype=pl.Object
-            ),
-            pl.col("created_at").cast(pl.Utf8),
-        )
-
-        # msgspec validation (3-5x faster than Pydantic)
-        event_objs = [UserEventResponseMsg(**row) for row in df.to_dicts()]
-        events = [msgspec.structs.asdict(e) for e in event_objs]
+    if columns["id"]:
+        # Column-wise fetch: no per-row dict(record) before Polars
+        df = pl.DataFrame(columns, schema=USER_EVENTS_SCHEMA)
+
+        # msgspec validation (3-5x faster than Pydantic), straight from row tuples
+        # (created_at stays a datetime, encoded like the other user-event paths)
+        events = [UserEventResponseMsg(*row) for row in df.iter_rows()]
     else:
         events = []
+    encoded = orjson.Fragment(_EVENTS_ENCODER.encode(events))
     t_parse_end = time.perf_counter()
 
     return {
-        "events": events,
+        "events": encoded,
         "count": len(events),
         "query_time_ms": (t_query_end - t_query_start) * 1000,
         "parse_time_ms": (t_parse_end - t_parse_start) * 1000,
@@ -160,8 +158,6 @@ async def benchmark_all_approaches(user_id: int = 1, limit: int = 100) -> dict[s
     """
     Benchmark all 4 approaches and return comparison.
     """
-    from src.samples.pg_pydantic_dict import get_user_events_endpoint
-
     # Approach 1: Current (Pydantic)
     t0 = time.perf_counter()
     pydantic_events = await get_user_events_endpoint(user_id, limit)
@@ -6,21 +6,49 @@ Demonstrates asyncpg performance and connection pooling.
 import time
 from typing import Any
 
+import numpy as np
 from fastapi import HTTPException
 
 from src.lib.postgres_client import get_postgres
+from src.samples.msgspec_models import (
+    AnalyticsSummaryMsg,
+    ConversionFunnelMsg,
+    UserEventResponseMsg,
+)
 from src.samples.pydantic_models import (
-    AnalyticsSummary,
-    ConversionFunnel,
     UserEvent,
     UserEventResponse,
 )
 
+_BULK_EVENT_TYPES = ["page_view", "click", "conversion"]
+
+# Hot query shared by the user-event endpoints and benchmarks. asyncpg's per-connection
+# statement cache prepares it once per connection, keyed by this exact text.
+USER_EVENTS_QUERY = """
+    SELECT id, user_id, event_type, page_url, metadata, created_at
+    FROM user_events
+    WHERE user_id = $1
+    ORDER BY created_at DESC
+    LIMIT $2
+"""
+
+# Same rows with metadata left as JSON text (jsonb otherwise goes through the
+# pool's decoding codec), for callers that splice it into a response verbatim
+USER_EVENTS_TEXT_QUERY = """
+    SELECT id, user_id, event_type, page_url, metadata::text AS metadata, created_at
+    FROM user_events
+    WHERE user_id = $1
+    ORDER BY created_at DESC
+    LIMIT $2
+"""
 
-async def create_event_endpoint(event: UserEvent) -> UserEventResponse:
-    """Insert a user event into PostgreSQL."""
-    import json
 
+async def create_event_endpoint(event: UserEvent) -> UserEventResponseMsg:
+    """
+    Insert a user event into PostgreSQL.
+    The inserted row comes back as a msgspec struct (no Pydantic model on the
+    way out); RETURNING lists the columns in struct field order.
+    """
     pg = get_postgres()
 
     row = await pg.fetchrow(
@@ -32,56 +60,27 @@ async def create_event_endpoint(event: UserEvent) -> UserEventResponse:
         event.user_id,
         event.event_type,
         event.page_url,
-        json.dumps(event.metadata),  # Convert dict to JSON string
+        event.metadata,  # Encoded by the pool's jsonb codec
     )
 
     if not row:
         raise HTTPException(status_code=500, detail="Failed to insert event")
 
-    # Parse the returned JSONB field back to dict
-    event_data = dict(row)
-    event_data["metadata"] = (
-        json.loads(event_data["metadata"])
-        if isinstance(event_data["metadata"], str)
-        else event_data["metadata"]
-    )
-
-    return UserEventResponse(**event_data)
+    # metadata comes back as a dict (decoded by the pool's jsonb codec)
+    return UserEventResponseMsg(row[0], row[1], row[2], row[3], row[4], row[5])
 
 
 async def get_user_events_endpoint(user_id: int, limit: int = 100) -> list[UserEventResponse]:
     """Get all events for a specific user."""
-    import json
-
     pg = get_postgres()
 
-    rows = await pg.fetch(
-        """
-        SELECT id, user_id, event_type, page_url, metadata, created_at
-        FROM user_events
-        WHERE user_id = $1
-        ORDER BY created_at DESC
-        LIMIT $2
-        """,
-        user_id,
-        limit,
-    )
+    rows = await pg.fetch(USER_EVENTS_QUERY, user_id, limit)
 
-    # Parse metadata JSON string to dict for each row
-    events = []
-    for row in rows:
-        event_data = dict(row)
-        event_data["metadata"] = (
-            json.loads(event_data["metadata"])
-            if isinstance(event_data["metadata"], str)
-            else event_data["metadata"]
-        )
-        events.append(UserEventResponse(**event_data))
-
-    return events
+    # metadata is already a dict (decoded by the pool's jsonb codec)
+    return [UserEventResponse(**dict(row)) for row in rows]
 
 
-async def get_analytics_summary_endpoint() -> AnalyticsSummary:
+async def get_analytics_summary_endpoint() -> AnalyticsSummaryMsg:
     """
     Get aggregated analytics summary.
     Compares PostgreSQL vs DuckDB for OLAP queries.
@@ -122,7 +121,7 @@ async def get_analytics_summary_endpoint() -> AnalyticsSummary:
         "conversion": row["conversions"],
     }
 
-    return AnalyticsSummary(
+    return AnalyticsSummaryMsg(
         total_events=row["total_events"],
         unique_users=row["unique_users"],
         events_by_type=events_by_type,
@@ -132,8 +131,8 @@ async def get_analytics_summary_endpoint() -> AnalyticsSummary:
     )
 
 
-async def get_conversion_funnel_endpoint() -> list[ConversionFunnel]:
-    """Get conversion funnel by page."""
+async def get_conversion_funnel_endpoint() -> list[ConversionFunnelMsg]:
+    """Get conversion funnel by page (structs built positionally, in SELECT column order)."""
     pg = get_postgres()
 
     rows = await pg.fetch(
@@ -157,38 +156,42 @@ async def get_conversion_funnel_endpoint() -> list[ConversionFunnel]:
         """
     )
 
-    return [ConversionFunnel(**dict(row)) for row in rows]
+    return [ConversionFunnelMsg(*row) for row in rows]
 
 
 async def bulk_insert_events_endpoint(count: int = 1000) -> dict[str, Any]:
     """Bulk insert events for performance testing."""
-    import json
-    import random
-
     if count > 10000:
         raise HTTPException(status_code=400, detail="Max 10,000 events per bulk insert")
 
     pg = get_postgres()
 
-    # Prepare batch data
+    # Prepare batch data column-wise with numpy, then zip once into row tuples
+    rng = np.random.default_rng()
+    user_ids = rng.integers(1, 101, count).tolist()
+    event_types = rng.choice(_BULK_EVENT_TYPES, count).tolist()
+    pages = rng.integers(1, 21, count).tolist()
+    durations = rng.integers(1, 61, count).tolist()
+
     events = [
         (
-            random.randint(1, 100),  # nosec B311 (test data)
-            random.choice(["page_view", "click", "conversion"]),  # nosec B311
-            f"/page-{random.randint(1, 20)}",  # nosec B311
-            json.dumps(
-                {"duration": random.randint(1, 60), "test": True}  # nosec B311
-            ),  # metadata as JSON string
+            user_id,
+            event_type,
+            f"/page-{page}",
+            {"duration": duration, "test": True},  # metadata, encoded by the jsonb codec
+        )
+        for user_id, event_type, page, duration in zip(
+            user_ids, event_types, pages, durations, strict=True
         )
-        for _ in range(count)
     ]
 
     t0 = time.perf_counter()
 
-    # Use executemany for batch insert
-    await pg.executemany(
-        "INSERT INTO user_events (user_id, event_type, page_url, metadata) VALUES ($1, $2, $3, $4)",
+    # Use binary COPY for batch insert (single round trip)
+    await pg.copy_records(
+        "user_events",
         events,
+        columns=["user_id", "event_type", "page_url", "metadata"],
     )
 
     t1 = time.perf_counter()
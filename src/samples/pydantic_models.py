@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field
 
 
 class DataPoint(BaseModel):
@@ -37,13 +37,9 @@ class ProcessingStats(BaseModel):
     mean_value: float
     max_value: float
     by_category: dict[str, float]  # Average value by category
-
-    @computed_field
-    def processing_speed_score(self) -> float:
-        """
-        A dummy computed field to demonstrate Pydantic v2 computed fields.
-        """
-        return self.total_records * 1.5
+    # Dummy score (total_records * 1.5), materialized by the producer at construction
+    # instead of a @computed_field re-run on every serialization
+    processing_speed_score: float
 
 
 # ========================================================================
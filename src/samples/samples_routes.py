@@ -3,15 +3,19 @@ Sample Routes - All testing and demonstration endpoints
 Framework capabilities, benchmarks, and experimental features
 """
 
+import asyncio
 import time
 from typing import Any
 
 import msgspec
-from fastapi import APIRouter, Body
+import orjson
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import HTMLResponse, Response
 
 from src.lib.logger import get_logger
-from src.samples.extras import SearchEngine, render_report
+from src.middleware.compression import accepts_zstd
+from src.samples.extras import SearchEngine, render_report_from_struct
+from src.samples.msgspec_models import FastBatchData, FastBatchDataColumnar, ProcessingStatsMsg
 from src.samples.pydantic_models import (
     AnalyticsSummary,
     BatchData,
@@ -25,7 +29,10 @@ from src.samples.services import (
     generate_large_dataset,
     get_batch_stats_cached,
     get_batch_stats_with_decorator,
+    get_large_json_bodies,
+    process_columnar_with_duckdb,
     process_data_batch,
+    process_points_batch,
     process_with_duckdb,
 )
 
@@ -34,6 +41,35 @@ logger = get_logger(__name__)
 # Create router for all sample/test endpoints
 router = APIRouter(tags=["Samples & Testing"])
 
+# Typed decoders/encoder built once - the free msgspec.json functions would
+# look up the type's decoding plan on every call
+_BATCH_DECODER = msgspec.json.Decoder(FastBatchData)
+_COLUMNAR_DECODER = msgspec.json.Decoder(FastBatchDataColumnar)
+_STATS_DECODER = msgspec.json.Decoder(ProcessingStatsMsg)
+_JSON_ENCODER = msgspec.json.Encoder()
+
+# Same options as the app's default response class (FastORJSONResponse)
+_JSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+)
+
+
+def _json_response(payload: Any) -> Response:
+    """
+    Pre-encode a payload with orjson and return it as-is.
+    FastAPI passes Response objects straight through, skipping jsonable_encoder
+    and response_model validation.
+    """
+    return Response(orjson.dumps(payload, option=_JSON_OPTIONS), media_type="application/json")
+
+
+async def _decode_batch(request: Request) -> FastBatchData:
+    """Decode and validate a batch body with msgspec (no Pydantic models involved)."""
+    try:
+        return _BATCH_DECODER.decode(await request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
 
 # =============================================================================
 # Framework Demonstration Routes
@@ -57,25 +93,30 @@ async def sample_root() -> dict[str, str]:
 async def search(q: str, limit: int = 10) -> dict[str, Any]:
     """
     Searches the in-memory index using Tantivy (Rust).
-    Demonstrates: Rust integration, in-memory indexing
+    Demonstrates: Rust integration, in-memory indexing, searcher pool off the event loop
     """
-    t0 = time.perf_counter()
-    results = SearchEngine.get_instance().search(q, limit)
-    t1 = time.perf_counter()
-    return {"query": q, "hits": len(results), "duration_ms": (t1 - t0) * 1000, "results": results}
+    t0 = time.perf_counter_ns()
+    results = await asyncio.to_thread(SearchEngine.get_instance().search, q, limit)
+    duration_ms = (time.perf_counter_ns() - t0) / 1_000_000
+    return {"query": q, "hits": len(results), "duration_ms": duration_ms, "results": results}
 
 
 @router.post("/render", response_class=HTMLResponse)
-async def render_html(stats: ProcessingStats) -> Response:
+async def render_html(request: Request) -> Response:
     """
     Renders a report HTML using MiniJinja (Rust).
     Demonstrates: Template rendering with Rust-based MiniJinja
+    The ProcessingStats body is decoded with msgspec (no Pydantic model).
     """
-    t0 = time.perf_counter()
-    html = render_report(stats.model_dump())
-    t1 = time.perf_counter()
+    try:
+        stats = _STATS_DECODER.decode(await request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    t0 = time.perf_counter_ns()
+    html = render_report_from_struct(stats)
+    render_ms = (time.perf_counter_ns() - t0) / 1_000_000
     return Response(
-        content=html, media_type="text/html", headers={"X-Render-Time-Ms": str((t1 - t0) * 1000)}
+        content=html, media_type="text/html", headers={"X-Render-Time-Ms": str(render_ms)}
     )
 
 
@@ -90,38 +131,50 @@ async def batch_processing(batch: BatchData) -> ProcessingStats:
     Process data batch with Polars + DuckDB.
     Demonstrates: Polars DataFrames, DuckDB in-memory analytics
     """
-    data_dicts = [d.model_dump() for d in batch.data]
+    # One model_dump walks the whole batch in pydantic-core (no per-item Python loop)
+    data_dicts = batch.model_dump(include={"data"})["data"]
     return await process_data_batch(batch.batch_id, data_dicts)
 
 
 @router.post("/batch-msgspec")
-async def batch_processing_msgspec(batch: BatchData = Body(...)) -> dict[str, Any]:  # noqa: B008
+async def batch_processing_msgspec(request: Request) -> Response:
     """
-    Process data batch using msgspec internally (faster validation).
+    Process data batch using msgspec end-to-end (faster validation).
     Demonstrates: msgspec for 3-5x faster validation than Pydantic
-    Note: Input uses Pydantic for FastAPI compatibility, msgspec used internally
+    Note: Body is decoded straight into msgspec structs, bypassing FastAPI's Pydantic layer
     """
-    from src.samples.msgspec_models import FastProcessingStats
-
-    raw_data = [d.model_dump() for d in batch.data]
-    stats = await process_data_batch(batch.batch_id, raw_data)
-    # Return dict for JSON serialization
-    result = FastProcessingStats(**stats.model_dump())
-    return msgspec.structs.asdict(result)
+    batch = await _decode_batch(request)
+    result = await process_points_batch(batch.batch_id, batch.data)
+    # Encode the struct directly - no dict or jsonable_encoder pass
+    return Response(_JSON_ENCODER.encode(result), media_type="application/json")
 
 
 @router.post("/duckdb")
-async def duckdb_processing(batch: BatchData) -> dict[str, Any]:
+async def duckdb_processing(request: Request) -> Response:
     """
     Process data using DuckDB SQL.
-    Demonstrates: DuckDB SQL engine for OLAP queries
+    Demonstrates: DuckDB SQL engine for OLAP queries, msgspec decoding straight to Arrow
     """
-    data = [d.model_dump() for d in batch.data]
-    return await process_with_duckdb(batch.batch_id, data)
+    batch = await _decode_batch(request)
+    return _json_response(await process_with_duckdb(batch.batch_id, batch.data))
+
+
+@router.post("/duckdb-columnar")
+async def duckdb_columnar_processing(request: Request) -> Response:
+    """
+    Process a columnar batch (one array per field) using DuckDB SQL.
+    Demonstrates: struct-of-arrays payloads, zero-copy Arrow registration in DuckDB
+    """
+    try:
+        # Validates element constraints and equal column lengths before the worker thread
+        batch = _COLUMNAR_DECODER.decode(await request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    return _json_response(await process_columnar_with_duckdb(batch))
 
 
 @router.get("/duckdb-cached")
-async def duckdb_cached_endpoint(batch_id: str, size: int = 100) -> dict[str, Any]:
+async def duckdb_cached_endpoint(batch_id: str, size: int = 100) -> Response:
     """
     DuckDB processing with Valkey caching (manual logic).
     Demonstrates: Valkey caching, xxhash cache keys, zstandard compression
@@ -131,40 +184,68 @@ async def duckdb_cached_endpoint(batch_id: str, size: int = 100) -> dict[str, An
 
 
 @router.get("/duckdb-cached-decorator")
-async def duckdb_decorator_endpoint(batch_id: str, size: int = 100) -> dict[str, Any]:
+async def duckdb_decorator_endpoint(batch_id: str, size: int = 100) -> Response:
     """
     DuckDB processing with @valkey_cache decorator.
-    Demonstrates: Decorator-based caching with Valkey
+    Demonstrates: Decorator-based caching with Valkey, raw cached bytes as the response body
     """
     data = await generate_large_dataset(size)
-    return await get_batch_stats_with_decorator(batch_id, data)  # type: ignore[no-any-return]
+    # The decorator hashes its arguments into the cache key, so it gets the rows
+    # as plain dicts (a DataFrame would only contribute its truncated repr)
+    return await get_batch_stats_with_decorator(batch_id, data.to_dicts())  # type: ignore[no-any-return]
 
 
 @router.get("/benchmark/{size}")
-async def benchmark_endpoint(size: int) -> dict[str, Any]:
+async def benchmark_endpoint(size: int) -> Response:
     """
     Generate large dataset and benchmark serialization.
     Demonstrates: ORJSON serialization performance
     """
-    t0 = time.perf_counter()
+    t0 = time.perf_counter_ns()
     data = await generate_large_dataset(size)
-    t1 = time.perf_counter()
-    return {
-        "size": size,
-        "records": len(data),
-        "generation_time_ms": (t1 - t0) * 1000,
-        "sample": data[:3] if data else [],
-    }
+    generation_ms = (time.perf_counter_ns() - t0) / 1_000_000
+    return _json_response(
+        {
+            "size": size,
+            "records": len(data),
+            "generation_time_ms": generation_ms,
+            "sample": data.head(3).to_dicts(),
+        }
+    )
 
 
 @router.get("/large-json")
-async def large_json_response() -> dict[str, Any]:
+async def large_json_response(request: Request) -> Response:
     """
-    Generate large JSON response to test serialization.
-    Demonstrates: ORJSON performance with large payloads
+    Serve a large JSON payload from pre-encoded bytes.
+    Demonstrates: keeping expensive artifacts resident (encoded and zstd-compressed once)
+    and HTTP caching: the body is fixed for the process lifetime, so clients revalidate
+    with If-None-Match and get an empty 304 instead of the payload.
     """
-    data = await generate_large_dataset(10000)
-    return {"count": len(data), "data": data}
+    bodies = await get_large_json_bodies()
+    if accepts_zstd(request.headers.get("accept-encoding", "").encode("latin-1")):
+        # Already compressed: ZstdMiddleware passes content-encoded bodies through
+        body, etag, encoding = (
+            bodies.compressed,
+            bodies.compressed_etag,
+            {"content-encoding": "zstd"},
+        )
+    else:
+        body, etag, encoding = bodies.raw, bodies.etag, {}
+    headers = {"etag": etag, "cache-control": "public, max-age=300", "vary": "Accept-Encoding"}
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers | encoding)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 specifies for this header)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
 
 
 # =============================================================================
@@ -188,7 +269,7 @@ async def benchmark_postgres_polars(
 
 
 @router.get("/pg/benchmark-all")
-async def benchmark_all_postgres_approaches(user_id: int = 1, limit: int = 100) -> dict[str, Any]:
+async def benchmark_all_postgres_approaches(user_id: int = 1, limit: int = 100) -> Response:
     """
     Benchmark ALL 4 approaches for PostgreSQL:
     1. Pydantic + dict/list (baseline)
@@ -200,7 +281,9 @@ async def benchmark_all_postgres_approaches(user_id: int = 1, limit: int = 100)
     """
     from src.samples.pg_polars_msgspec import benchmark_all_approaches
 
-    return await benchmark_all_approaches(user_id, limit)
+    # The Polars variant returns its events as a pre-encoded orjson.Fragment,
+    # which only orjson can serialize
+    return _json_response(await benchmark_all_approaches(user_id, limit))
 
 
 @router.get("/pg/duckdb-compare")
@@ -214,44 +297,55 @@ async def compare_analytics_engines() -> dict[str, Any]:
     return await compare_engines_analytics()
 
 
-@router.get("/iceberg/benchmark")
+@router.get("/iceberg/benchmark", response_model=list[IcebergBenchmarkResult])
 async def benchmark_iceberg(
     s3_path: str = "s3://liquid-crystal-bucket-manoj/dumped-clustred-data/source_data_iceberg",
-) -> list[IcebergBenchmarkResult]:
+) -> Response:
     """
     Run performance benchmarks on Iceberg table in S3.
     Demonstrates: DuckDB Iceberg extension, S3 integration, Clustered Query Performance
+    The runner's msgspec structs are encoded in one pass (no Pydantic round-trip);
+    response_model is kept for the OpenAPI schema only.
     """
     from performance_test_suite.iceberg_runner import run_iceberg_benchmarks
 
     results = await run_iceberg_benchmarks(s3_path)
-    # Convert msgspec structs to Pydantic models for FastAPI response
-    return [IcebergBenchmarkResult(**msgspec.structs.asdict(r)) for r in results]
+    return Response(_JSON_ENCODER.encode(results), media_type="application/json")
 
 
 # =============================================================================
 # PostgreSQL Production Endpoints
 # =============================================================================
 
+from src.samples.pg_polars_msgspec import fetch_user_events_structs  # noqa: E402
 from src.samples.pg_pydantic_dict import (  # noqa: E402
     bulk_insert_events_endpoint,
     create_event_endpoint,
     get_analytics_summary_endpoint,
     get_conversion_funnel_endpoint,
-    get_user_events_endpoint,
 )
 
 
-@router.post("/events", response_model=UserEventResponse)
-async def create_event(event: UserEvent) -> UserEventResponse:
-    """Create a new user event."""
-    return await create_event_endpoint(event)
+@router.post("/events", response_model=UserEventResponse, status_code=201)
+async def create_event(event: UserEvent) -> Response:
+    """
+    Create a new user event.
+    The inserted row is encoded straight from its msgspec struct;
+    response_model is kept for the OpenAPI schema only.
+    """
+    event_out = await create_event_endpoint(event)
+    return Response(_JSON_ENCODER.encode(event_out), status_code=201, media_type="application/json")
 
 
 @router.get("/events/{user_id}", response_model=list[UserEventResponse])
-async def get_user_events(user_id: int, limit: int = 100) -> list[UserEventResponse]:
-    """Get user events with pagination."""
-    return await get_user_events_endpoint(user_id, limit)
+async def get_user_events(user_id: int, limit: int = 100) -> Response:
+    """
+    Get user events with pagination.
+    Rows go straight into msgspec structs and are encoded to bytes once;
+    response_model is kept for the OpenAPI schema only.
+    """
+    events = await fetch_user_events_structs(user_id, limit)
+    return Response(_JSON_ENCODER.encode(events), media_type="application/json")
 
 
 @router.post("/events/bulk")
@@ -261,12 +355,14 @@ async def bulk_insert_events(count: int = 1000) -> dict[str, Any]:
 
 
 @router.get("/analytics/summary", response_model=AnalyticsSummary)
-async def get_analytics_summary() -> AnalyticsSummary:
-    """Get analytics summary (PostgreSQL aggregation)."""
-    return await get_analytics_summary_endpoint()
+async def get_analytics_summary() -> Response:
+    """Get analytics summary (PostgreSQL aggregation), encoded straight from its struct."""
+    summary = await get_analytics_summary_endpoint()
+    return Response(_JSON_ENCODER.encode(summary), media_type="application/json")
 
 
 @router.get("/analytics/conversion-funnel", response_model=list[ConversionFunnel])
-async def get_conversion_funnel() -> list[ConversionFunnel]:
-    """Get conversion funnel metrics."""
-    return await get_conversion_funnel_endpoint()
+async def get_conversion_funnel() -> Response:
+    """Get conversion funnel metrics, encoded straight from their structs."""
+    funnel = await get_conversion_funnel_endpoint()
+    return Response(_JSON_ENCODER.encode(funnel), media_type="application/json")
@@ -0,0 +1,53 @@
+"""zstd compression: Accept-Encoding negotiation and response headers."""
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from src.middleware.compression import ZstdMiddleware, accepts_zstd
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        (b"zstd", True),
+        (b"gzip, deflate, br, zstd", True),
+        (b"ZSTD", True),
+        (b"zstd;q=0.5, gzip", True),
+        (b"gzip, zstd ; q=1.0", True),
+        (b"zstd;q=0", False),
+        (b"gzip, zstd;q=0.0", False),
+        (b"zstd;q=bogus", False),
+        (b"gzip, br", False),
+        (b"", False),
+    ],
+)
+def test_accepts_zstd(accept_encoding: bytes, expected: bool) -> None:
+    assert accepts_zstd(accept_encoding) is expected
+
+
+def _vary_after_compression(vary: str | None) -> list[str]:
+    """Vary header values of a compressed response whose handler set `vary`."""
+    app = FastAPI()
+    app.add_middleware(ZstdMiddleware, minimum_size=10)
+
+    @app.get("/")
+    def body() -> Response:
+        return Response(b"x" * 1000, headers={"vary": vary} if vary else None)
+
+    response = TestClient(app).get("/", headers={"accept-encoding": "zstd"})
+    assert response.headers["content-encoding"] == "zstd"
+    return response.headers.get_list("vary")
+
+
+@pytest.mark.parametrize(
+    ("vary", "expected"),
+    [
+        (None, "Accept-Encoding"),
+        ("Origin", "Origin, Accept-Encoding"),
+        ("Accept-Encoding", "Accept-Encoding"),
+        ("Origin, accept-encoding", "Origin, accept-encoding"),
+    ],
+)
+def test_vary_lists_accept_encoding_once(vary: str | None, expected: str) -> None:
+    assert _vary_after_compression(vary) == [expected]
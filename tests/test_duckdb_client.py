@@ -0,0 +1,31 @@
+"""DuckDB connection pool checkout/return."""
+
+import pytest
+
+from src.lib.duckdb_client import DuckDBConnectionPool
+
+
+@pytest.fixture(scope="module")
+def pool() -> DuckDBConnectionPool:
+    return DuckDBConnectionPool(pool_size=2)
+
+
+async def test_idle_connections_takes_and_returns_all(pool: DuckDBConnectionPool) -> None:
+    async with pool.idle_connections() as conns:
+        assert len(conns) == 2
+        async with pool.idle_connections() as none_left:
+            assert none_left == []
+
+    async with pool.idle_connections() as conns:
+        assert len(conns) == 2
+
+
+async def test_idle_connections_returned_on_error(pool: DuckDBConnectionPool) -> None:
+    with pytest.raises(ValueError):
+        async with pool.idle_connections():
+            raise ValueError("boom")
+
+    async with pool.connection() as conn:
+        assert conn.execute("SELECT 1").fetchone() == (1,)
+    async with pool.idle_connections() as conns:
+        assert len(conns) == 2
@@ -0,0 +1,62 @@
+"""In-process cache in front of the Iceberg metadata resolver."""
+
+import asyncio
+
+import pytest
+
+from src.lib import iceberg_utils
+
+
+@pytest.fixture
+def resolver(monkeypatch: pytest.MonkeyPatch) -> dict[str, object]:
+    """Fake resolver: records calls; paths in `blocked` wait until their event is set."""
+    state: dict[str, object] = {"calls": [], "blocked": {}}
+
+    async def resolve(s3_path: str) -> dict[str, object]:
+        state["calls"].append(s3_path)  # type: ignore[attr-defined]
+        event = state["blocked"].get(s3_path)  # type: ignore[attr-defined]
+        if event is not None:
+            await event.wait()
+        return {
+            "data": f"{s3_path}/metadata/v1.metadata.json",
+            "cache_hit": False,
+            "source": "valkey",
+        }
+
+    monkeypatch.setattr(iceberg_utils, "_resolve_latest_metadata_file", resolve)
+    monkeypatch.setattr(iceberg_utils, "_ttl", {})
+    monkeypatch.setattr(iceberg_utils, "_path_locks", {})
+    return state
+
+
+async def test_slow_path_does_not_block_other_paths(resolver: dict[str, object]) -> None:
+    slow = asyncio.Event()
+    resolver["blocked"] = {"s3://bucket/slow": slow}
+
+    slow_task = asyncio.create_task(iceberg_utils.get_latest_metadata_file("s3://bucket/slow"))
+    await asyncio.sleep(0)
+    fast = await asyncio.wait_for(
+        iceberg_utils.get_latest_metadata_file("s3://bucket/fast"), timeout=1
+    )
+    assert fast["data"] == "s3://bucket/fast/metadata/v1.metadata.json"
+    assert not slow_task.done()
+
+    slow.set()
+    assert (await slow_task)["data"] == "s3://bucket/slow/metadata/v1.metadata.json"
+
+
+async def test_concurrent_misses_for_one_path_resolve_once(resolver: dict[str, object]) -> None:
+    gate = asyncio.Event()
+    resolver["blocked"] = {"s3://bucket/t": gate}
+
+    tasks = [
+        asyncio.create_task(iceberg_utils.get_latest_metadata_file("s3://bucket/t"))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    gate.set()
+    results = await asyncio.gather(*tasks)
+
+    assert resolver["calls"] == ["s3://bucket/t"]
+    assert [r["source"] for r in results].count("local") == 2
+    assert iceberg_utils._path_locks == {}
@@ -0,0 +1,30 @@
+"""Trace correlation fields added to log records."""
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF, ALWAYS_ON
+
+from src.lib.logger import add_open_telemetry_spans
+
+
+def test_unsampled_span_keeps_trace_ids() -> None:
+    tracer = TracerProvider(sampler=ALWAYS_OFF).get_tracer("test")
+    with tracer.start_as_current_span("request") as span:
+        assert not span.is_recording()
+        ctx = span.get_span_context()
+        event = add_open_telemetry_spans(None, "info", {"event": "hello"})
+
+    assert event["trace_id"] == format(ctx.trace_id, "032x")
+    assert event["span_id"] == format(ctx.span_id, "016x")
+
+
+def test_sampled_span_gets_log_event() -> None:
+    tracer = TracerProvider(sampler=ALWAYS_ON).get_tracer("test")
+    with tracer.start_as_current_span("request") as span:
+        event = add_open_telemetry_spans(None, "info", {"event": "hello", "n": 1})
+
+    assert "trace_id" in event
+    assert [(e.name, e.attributes["n"]) for e in span.events] == [("hello", 1)]
+
+
+def test_no_span_adds_nothing() -> None:
+    assert add_open_telemetry_spans(None, "info", {"event": "hello"}) == {"event": "hello"}
@@ -0,0 +1,56 @@
+"""Polars user-event JSON encoding (no database needed)."""
+
+from datetime import UTC, datetime
+
+import msgspec
+import orjson
+import polars as pl
+import pytest
+
+from src.samples.msgspec_models import UserEventResponseMsg
+from src.samples.pg_polars_msgspec import _USER_EVENTS_TEXT_SCHEMA, events_json_array
+from src.samples.pydantic_models import UserEventResponse
+
+
+def _events_frame(metadata: list[str | None]) -> pl.DataFrame:
+    n = len(metadata)
+    return pl.DataFrame(
+        {
+            "id": list(range(1, n + 1)),
+            "user_id": [7] * n,
+            "event_type": ["click"] * n,
+            "page_url": ["/page-1"] * n,
+            "metadata": metadata,
+            "created_at": [datetime(2025, 1, 1, 12, 0)] * n,
+        },
+        schema=_USER_EVENTS_TEXT_SCHEMA,
+    )
+
+
+def test_null_metadata_row_is_kept() -> None:
+    # metadata is nullable (JSONB DEFAULT '{}'), a NULL must not drop the event
+    events = orjson.loads(events_json_array(_events_frame(['{"duration": 5}', None])))
+
+    assert [e["id"] for e in events] == [1, 2]
+    assert events[0]["metadata"] == {"duration": 5}
+    assert events[1]["metadata"] is None
+
+
+def test_empty_frame_is_empty_array() -> None:
+    assert events_json_array(_events_frame([])) == "[]"
+
+
+@pytest.mark.parametrize(
+    "created_at",
+    [datetime(2025, 1, 1, 12, 0, 0, 123456), datetime(2025, 1, 1, 12, 0, tzinfo=UTC)],
+)
+def test_struct_created_at_matches_pydantic(created_at: datetime) -> None:
+    # Same wire format as the UserEventResponse model the struct replaced
+    fields = {"id": 1, "user_id": 7, "event_type": "click", "page_url": "/p", "metadata": {}}
+    struct = UserEventResponseMsg(**fields, created_at=created_at)
+    model = UserEventResponse(**fields, created_at=created_at)
+
+    assert (
+        msgspec.json.decode(msgspec.json.encode(struct))["created_at"]
+        == model.model_dump(mode="json")["created_at"]
+    )
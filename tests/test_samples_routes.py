@@ -0,0 +1,86 @@
+"""Samples routes that run without external services."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.samples.samples_routes import router
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    app = FastAPI()
+    app.include_router(router, prefix="/samples")
+    return TestClient(app)
+
+
+def test_large_json_zstd_refused_with_q0(client: TestClient) -> None:
+    response = client.get("/samples/large-json", headers={"accept-encoding": "zstd;q=0, gzip"})
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.json()["count"] > 0
+
+
+def test_large_json_zstd_accepted(client: TestClient) -> None:
+    response = client.get("/samples/large-json", headers={"accept-encoding": "zstd"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "zstd"
+    assert response.headers["etag"].endswith('-zstd"')
+
+
+def test_large_json_revalidates_with_304(client: TestClient) -> None:
+    etag = client.get("/samples/large-json", headers={"accept-encoding": "identity"}).headers[
+        "etag"
+    ]
+    response = client.get(
+        "/samples/large-json", headers={"accept-encoding": "identity", "if-none-match": etag}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def _columnar_body(**overrides: object) -> dict[str, object]:
+    body: dict[str, object] = {
+        "batch_id": "b",
+        "ids": [1, 2],
+        "timestamps": [1.0, 2.0],
+        "categories": ["A", "B"],
+        "values": [1.0, 2.0],
+        "tags": [[], []],
+    }
+    body.update(overrides)
+    return body
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"timestamps": [1.0]},  # ragged: shorter than ids
+        {"tags": [[], [], []]},  # ragged: longer than ids
+        {"categories": ["A", "b"]},  # same pattern as FastDataPoint.category
+        {"values": [1.0, 1000.5]},  # same range as FastDataPoint.value
+    ],
+)
+def test_duckdb_columnar_rejects_invalid_batch(
+    client: TestClient, overrides: dict[str, object]
+) -> None:
+    response = client.post("/samples/duckdb-columnar", json=_columnar_body(**overrides))
+
+    assert response.status_code == 422
+
+
+def test_render_requires_processing_speed_score(client: TestClient) -> None:
+    stats = {
+        "batch_id": "b",
+        "total_records": 2,
+        "mean_value": 1.0,
+        "max_value": 2.0,
+        "by_category": {"A": 1.0},
+    }
+
+    assert client.post("/samples/render", json=stats).status_code == 422
+    response = client.post("/samples/render", json={**stats, "processing_speed_score": 3.0})
+    assert response.status_code == 200
@@ -0,0 +1,17 @@
+"""valkey_cache decorator configuration (no Valkey server needed)."""
+
+import pytest
+
+from src.lib.valkey_cache import ORJSON_SERIALIZER, valkey_cache
+
+
+def test_serializer_rejected_with_raw_response() -> None:
+    with pytest.raises(ValueError, match="raw_response"):
+        valkey_cache(serializer=ORJSON_SERIALIZER, raw_response=True)
+
+
+def test_serializer_allowed_without_raw_response() -> None:
+    async def fetch() -> int:
+        return 1
+
+    assert callable(valkey_cache(serializer=ORJSON_SERIALIZER)(fetch))